@@ -4,13 +4,175 @@ Deepweb-style hacker forum interface with threads and posts
 """
 
 import pygame
+import io
+import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import IntEnum
 from typing import Tuple, List, Dict, Optional
 from datetime import datetime, timedelta
 import random
+from src.core.save_load import SaveLoadManager
+from src.systems.notification_manager import get_notification_manager
+from src.ui.forum_auth import ForumAuth
 from src.ui.forum_theme import ForumTheme
-
+from src.ui.inbox import Inbox
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class Category:
+    """Immutable forum category descriptor"""
+    id: str
+    name: str
+    description: str
+    threads: int
+    posts: int
+    icon: str
+
+
+# Categories never change at runtime; build them once at import instead of
+# allocating fresh dicts on every ForumBrowser instantiation
+CATEGORIES: Tuple[Category, ...] = (
+    Category('welcome', 'Bienvenue & Regles',
+             'Nouvelles recrues, commencez ici', 12, 156, '[i]'),
+    Category('network_security', 'Securite Reseau',
+             'Firewalls, IDS, architecture reseau', 89, 1247, '[S]'),
+    Category('pentesting', 'Pentest & Red Team',
+             'Tests d\'intrusion, exploits, CTF', 156, 3421, '[P]'),
+    Category('crypto', 'Cryptographie',
+             'Chiffrement, hash, steganographie', 67, 892, '[C]'),
+    Category('malware', 'Analyse Malware',
+             'Reverse engineering, sandboxing', 134, 2103, '[M]'),
+    Category('resources', 'Ressources & Tutos',
+             'Guides, outils, documentation', 203, 4567, '[R]'),
+    Category('marketplace', 'Marketplace',
+             'Echange de services et outils', 78, 945, '[$]'),
+    Category('offtopic', 'Off-Topic',
+             'Discussion generale', 234, 5123, '[O]'),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ToolSpec:
+    """Immutable marketplace tool descriptor"""
+    id: str
+    name: str
+    icon: str
+    description: str
+    size: str
+    price: int
+    unlocked_by: Optional[str]  # mission whose completion unlocks the tool
+    required_mission: str
+    # Derived once at construction so the row label is never re-formatted
+    display_size_price: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'display_size_price',
+                           f"Taille: {self.size} | Prix: {self.price}$")
+
+
+# fblits (pygame-ce) skips per-item argument parsing; older builds fall
+# back to blits
+_HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
+# Avatar search directories, resolved once at import; frozen builds also
+# look under the external data dir
+_AVATAR_DIRS: Tuple[str, ...] = (os.path.join("assets", "avatars"),)
+if getattr(sys, 'frozen', False):
+    _AVATAR_DIRS += (os.path.join(os.environ.get("CYBERHERO_DATA_DIR", "."),
+                                  "assets", "avatars"),)
+
+
+# Static marketplace catalogue, built once at import; only the per-player
+# "downloadable" state is computed at draw time
+_MARKET_TOOLS: Tuple[ToolSpec, ...] = (
+    ToolSpec("wireshark", "Wireshark", "W",
+             "Analyseur de paquets reseau professionnel",
+             "45.2 MB", 300, "mission1", "mission2"),
+    ToolSpec("pcap_analyzer", "PCAP Analyzer", "P",
+             "Analyseur de fichiers capture (hex dump)",
+             "8.5 MB", 400, "mission2", "mission3"),
+    ToolSpec("nmap_pro", "Nmap Pro", "N",
+             "Scanner de ports et vulnerabilites avance",
+             "12.8 MB", 150, None, "mission4"),
+    ToolSpec("metasploit", "Metasploit Framework", "M",
+             "Framework d'exploitation et pentest",
+             "234.5 MB", 0, None, "mission5"),
+    ToolSpec("burpsuite", "Burp Suite", "B",
+             "Proxy d'interception HTTP/HTTPS",
+             "89.1 MB", 0, None, "mission6"),
+    ToolSpec("hashcat", "Hashcat", "H",
+             "Cracker de mots de passe GPU",
+             "28.4 MB", 0, None, "mission7"),
+)
+
+_MARKET_TOOLS_BY_ID: Dict[str, ToolSpec] = {tool.id: tool for tool in _MARKET_TOOLS}
+
+
+class L(IntEnum):
+    """Indices into the precomputed layout table.
+
+    Names encode the design-space pixel value and the scale axis:
+    X* scale with scale_x, Y* with scale_y, S* with the uniform scale.
+    """
+    X5 = 0
+    X10 = 1
+    X12 = 2
+    X15 = 3
+    X20 = 4
+    X30 = 5
+    X35 = 6
+    X40 = 7
+    X50 = 8
+    X60 = 9
+    X80 = 10
+    X100 = 11
+    X110 = 12
+    X120 = 13
+    X130 = 14
+    X140 = 15
+    X200 = 16
+    X210 = 17
+    X220 = 18
+    X250 = 19
+    X500 = 20
+    X600 = 21
+    X700 = 22
+    X720 = 23
+    X800 = 24
+    X820 = 25
+    X920 = 26
+    Y5 = 27
+    Y6 = 28
+    Y8 = 29
+    Y10 = 30
+    Y12 = 31
+    Y15 = 32
+    Y20 = 33
+    Y30 = 34
+    Y35 = 35
+    Y38 = 36
+    Y40 = 37
+    Y45 = 38
+    Y50 = 39
+    Y55 = 40
+    Y60 = 41
+    Y70 = 42
+    Y75 = 43
+    Y80 = 44
+    Y85 = 45
+    Y400 = 46
+    S4 = 47
+    S5 = 48
+    S8 = 49
+    S10 = 50
+    S28 = 51
+    S100 = 52
+    S120 = 53
 
 class ForumThread:
     """Represents a forum thread"""
@@ -32,6 +194,48 @@ class ForumBrowser:
     Mimics underground hacker forums with categories, threads, and posts
     """
 
+    # Raw TTF bytes, read once per process and shared by all instances so
+    # each sized font is built from memory instead of re-opening the file
+    _FONT_PATH = os.path.join("assets", "fonts", "Cyberpunk.ttf")
+    _FONT_BYTES: Optional[bytes] = None
+
+    # Page transitions: page -> (target page, state attr to reset, reset value)
+    _BACK_NAV = {
+        "threads": ("categories", "selected_category", None),
+        "market": ("categories", None, None),
+        "inbox": ("categories", "selected_email_index", None),
+        "profile": ("categories", "edit_mode", False),
+    }
+    _BROWSER_BACK = {
+        "threads": ("categories", "selected_category", None),
+        "market": ("categories", None, None),
+        "thread_view": ("threads", None, None),
+    }
+    # Nav tab -> (target page, clear thread selection)
+    _NAV_TAB_TARGETS = {
+        "forum": ("categories", True),
+        "profile": ("profile", False),
+        "market": ("market", False),
+        "email": ("inbox", False),
+    }
+
+    @classmethod
+    def _load_font(cls, size: int) -> pygame.font.Font:
+        """Build a sized font without re-reading the TTF from disk"""
+        if cls._FONT_BYTES is None:
+            try:
+                with open(cls._FONT_PATH, 'rb') as f:
+                    cls._FONT_BYTES = f.read()
+            except OSError:
+                cls._FONT_BYTES = b""
+
+        if cls._FONT_BYTES:
+            try:
+                return pygame.font.Font(io.BytesIO(cls._FONT_BYTES), size)
+            except Exception:
+                pass
+        return pygame.font.Font(None, size)
+
     def __init__(self, screen, profile_data=None, is_logged_in=False):
         """
         Initialize forum browser
@@ -56,24 +260,104 @@ class ForumBrowser:
         ForumTheme.apply_to(self)
 
         # Fonts - using pygame directly for consistent sizes
-        try:
-            self.title_font = pygame.font.Font("assets/fonts/Cyberpunk.ttf", int(38 * self.scale))
-            self.heading_font = pygame.font.Font("assets/fonts/Cyberpunk.ttf", int(30 * self.scale))
-            self.body_font = pygame.font.Font("assets/fonts/Cyberpunk.ttf", int(24 * self.scale))
-            self.small_font = pygame.font.Font("assets/fonts/Cyberpunk.ttf", int(20 * self.scale))
-            self.url_font = pygame.font.Font("assets/fonts/Cyberpunk.ttf", int(18 * self.scale))
-        except:
-            self.title_font = pygame.font.Font(None, int(38 * self.scale))
-            self.heading_font = pygame.font.Font(None, int(30 * self.scale))
-            self.body_font = pygame.font.Font(None, int(24 * self.scale))
-            self.small_font = pygame.font.Font(None, int(20 * self.scale))
-            self.url_font = pygame.font.Font(None, int(18 * self.scale))
+        # (one disk read + five in-memory TTF parses via _load_font)
+        self.title_font = self._load_font(int(38 * self.scale))
+        self.heading_font = self._load_font(int(30 * self.scale))
+        self.body_font = self._load_font(int(24 * self.scale))
+        self.small_font = self._load_font(int(20 * self.scale))
+        self.url_font = self._load_font(int(18 * self.scale))
+
+        # Line heights are fixed per font; cache them instead of asking
+        # rendered surfaces (or the font) for them in the draw loops
+        self._title_line_h = self.title_font.get_height()
+        self._heading_line_h = self.heading_font.get_height()
+        self._body_line_h = self.body_font.get_height()
+        self._small_line_h = self.small_font.get_height()
+        self._url_line_h = self.url_font.get_height()
 
         # Browser chrome measurements
         self.browser_bar_height = int(50 * self.scale_y)
         self.url_bar_height = int(35 * self.scale_y)
         self.top_bar_height = int(40 * self.scale_y)
 
+        # Precomputed scaled layout constants, indexed by L (see above).
+        # Hot draw paths read self._layout[L.X15] instead of redoing the
+        # float multiply + int() on every frame
+        self._layout = self._build_layout()
+
+        # Cache of pre-rendered rounded rectangles keyed by
+        # (size, color, radius, width) - rounded pygame.draw.rect calls
+        # rasterize the corner arcs on every invocation
+        self._rr_cache = {}
+
+        # Rendered-text cache keyed by (font, text, color) so strings that
+        # repeat across frames are rasterized by SDL_ttf only once
+        self._text_cache = {}
+
+        # Permanent labels, baked once so the steady-state draw is a plain
+        # attribute read and blit with no cache lookup at all
+        self._lbl_inbox_header = self.title_font.render("MESSAGERIE", True, self.primary_color)
+        self._lbl_inbox_instructions = self.small_font.render("CLIC: Lire l'email | ESC: Retour", True, self.dim_text)
+        self._lbl_profile_instructions = self.small_font.render("ESC: Retour au forum", True, self.dim_text)
+        self._lbl_avatar_title = self.heading_font.render("CHOISIR UN AVATAR", True, self.text_bright)
+        self._lbl_avatar_close = self.small_font.render("Cliquer pour selectionner | ESC pour fermer", True, self.dim_text)
+
+        # Word-wrapped email layouts keyed by (id(email), max_width)
+        self._wrap_cache = {}
+
+        # Memoized body-font word widths shared by every wrap, plus the
+        # space width the running-sum measurement adds between words
+        self._word_widths = {}
+        self._space_width = self.body_font.size(' ')[0]
+
+        # Full-screen dim overlay, built lazily and reused by modal flows
+        self._dim_overlay = None
+
+        # Prebuilt market rows keyed by (tool_id, state) for the
+        # non-interactive states that never change within a session
+        self._market_row_cache = {}
+
+        # Row-band geometry recorded by the list pages so click handlers
+        # can compute the hit row arithmetically instead of scanning rects
+        self._category_hit = None
+        self._thread_hit = None
+        self._avatar_grid = None
+
+        # Active tool download state, advanced by the run() loop
+        self._download = None
+
+        # SaveLoadManager built on first save and reused afterwards
+        self._save_mgr = None
+
+        # Single frame clock shared by every loop this browser runs
+        self._clock = pygame.time.Clock()
+
+        # Snapshot of everything that affects pixels, used by run() to
+        # skip repainting frames where nothing changed, plus an explicit
+        # dirty flag for mutations the snapshot can't see
+        self._frame_state = None
+        self._dirty = True
+
+        # Mouse position sampled once per frame by run(); draw methods read
+        # this instead of asking SDL again
+        self._mouse_pos = pygame.mouse.get_pos()
+
+        # Per-page dispatch tables used by run() instead of if/elif ladders
+        self._page_draw_handlers = {
+            "welcome": self.draw_welcome_page,
+            "categories": self.draw_categories_page,
+            "threads": self.draw_threads_page,
+            "market": self.draw_market_page,
+            "inbox": self.draw_inbox_page,
+            "profile": self.draw_profile_page,
+        }
+        self._page_click_handlers = {
+            "categories": self.handle_category_click,
+            "threads": self.handle_thread_click,
+            "inbox": self.handle_email_click,
+            "market": self.handle_market_click,
+        }
+
         # Forum state
         # If already logged in from session, start on categories page
         if self._session_logged_in and self.profile_data.get('nickname', 'Nouveau Joueur') != 'Nouveau Joueur':
@@ -109,13 +393,7 @@ class ForumBrowser:
         # Dynamic avatar loading
         self.avatar_options = set()
         
-        # Search paths for avatars (bundled and external)
-        search_paths = [os.path.join("assets", "avatars")]
-        if getattr(sys, 'frozen', False):
-            data_dir = os.environ.get("CYBERHERO_DATA_DIR", ".")
-            search_paths.append(os.path.join(data_dir, "assets", "avatars"))
-            
-        for avatars_dir in search_paths:
+        for avatars_dir in _AVATAR_DIRS:
             if os.path.exists(avatars_dir):
                 try:
                     for f in os.listdir(avatars_dir):
@@ -131,7 +409,16 @@ class ForumBrowser:
             
         self.avatar_option_rects = []
         self.avatar_cache = {}
-        
+
+        # Async avatar decoding: PNG/JPEG decompression happens on worker
+        # threads so opening the avatar popup doesn't stall the render loop
+        self._avatar_loader = ThreadPoolExecutor(max_workers=2)
+        self._avatar_futures = {}
+        # Decoded + display-converted source images, one per file; sized
+        # variants in avatar_cache are derived from these without redecoding
+        self._avatar_src_cache = {}
+        self._avatar_placeholders = {}
+
         # Bio editing state
         self.editing_bio = False
         self.temp_bio = ""
@@ -141,84 +428,197 @@ class ForumBrowser:
         self.bio_input_rect = None
         self.exit_button_rect = None
 
+        # Navigation rects assigned by the draw methods; initialized here so
+        # the event loop can test them with plain None checks
+        self.back_button_rect = None
+        self.welcome_back_button = None
+        self.categories_back_button = None
+        self.threads_back_button = None
+        self.market_back_button = None
+        self.inbox_back_button = None
+        self.profile_back_button = None
+
         # Forum data
         self.categories = self.load_categories()
         self.threads = self.load_threads()
         self.emails = []  # Will be loaded from inbox
+        self._emails_loaded = False
+        self._inbox = None
+        # Cached rendering of the email reader panel; rebuilt only when the
+        # state captured in _email_panel_state changes
+        self._email_panel_surf = None
+        self._email_panel_state = None
+        self._email_thumb_rect = None
+        self._notification_manager = get_notification_manager()
         self.category_rects = {}
         self.thread_rects = {}
         self.email_rects = {}
+        self.market_tool_rects = {}
+        self.nav_tab_rects = {}
         self.login_button_rect = None
         self.register_button_rect = None
 
-    def load_categories(self) -> List[Dict]:
+    @property
+    def current_page(self):
+        return self._current_page
+
+    @current_page.setter
+    def current_page(self, value):
+        # Page transitions are rare; re-bind the per-page handlers here so
+        # the frame loop calls them directly instead of repeating the dict
+        # lookup for every event and every draw
+        self._current_page = value
+        self._current_draw_handler = self._page_draw_handlers.get(value)
+        self._current_click_handler = self._page_click_handlers.get(value)
+
+    def _rounded_rect_surface(self, size: Tuple[int, int], color,
+                              radius: int, width: int = 0) -> pygame.Surface:
+        """Get a pre-rendered rounded rect from the cache, rendering on miss"""
+        key = (size, color, radius, width)
+        surf = self._rr_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(surf, color, (0, 0, size[0], size[1]),
+                             width, border_radius=radius)
+            self._rr_cache[key] = surf
+        return surf
+
+    def _blit_round_rect(self, color, rect, radius: int, width: int = 0):
+        """Drop-in replacement for rounded pygame.draw.rect using the cache"""
+        rect = pygame.Rect(rect)
+        self.screen.blit(self._rounded_rect_surface(rect.size, color, radius, width),
+                         rect.topleft)
+
+    def _render_cached(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        """font.render with memoization for text that repeats across frames"""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            self._text_cache[key] = surf
+        return surf
+
+    def _email_body_width(self) -> int:
+        """Width available to wrapped body text in the reader pane.
+
+        Mirrors the geometry _draw_email_content derives each frame so the
+        wrap can be warmed at selection time.
+        """
+        content_width = self.screen_width - self._layout[L.X80]
+        return content_width - self._layout[L.X60] - self._layout[L.X12]
+
+    def _wrap_email_body(self, email, max_width: int) -> Tuple[Tuple[Tuple[str, int], ...], int]:
+        """Word-wrap an email body, cached per (email, width).
+
+        Returns (segments, total_height) where each segment is a
+        (line, y-offset) pair positioned relative to the top of the body,
+        so the draw pass only filters for visibility and blits. Blank
+        source lines become vertical spacing, not segments.
+        """
+        key = (id(email), max_width)
+        cached = self._wrap_cache.get(key)
+        if cached is not None:
+            return cached
+
+        line_height = self._body_line_h + self._layout[L.Y5]
+        blank_spacing = self._layout[L.Y15]
+        measure = self.body_font.size  # metrics only, no rasterization
+        word_widths = self._word_widths
+        space_w = self._space_width
+        segments = []
+        y = 0
+        for raw_line in email.body.split('\n'):
+            if raw_line.strip():
+                # Running sum of memoized per-word widths: each word is
+                # measured once ever instead of re-measuring every line
+                # prefix while it grows
+                current_words = []
+                running = 0
+                for word in raw_line.split(' '):
+                    width = word_widths.get(word)
+                    if width is None:
+                        width = word_widths[word] = measure(word)[0]
+                    if running + width + space_w > max_width and current_words:
+                        segments.append((' '.join(current_words), y))
+                        y += line_height
+                        current_words = [word]
+                        running = width + space_w
+                    else:
+                        current_words.append(word)
+                        running += width + space_w
+                if current_words:
+                    segments.append((' '.join(current_words), y))
+                    y += line_height
+            else:
+                y += blank_spacing
+
+        result = (tuple(segments), y)
+        self._wrap_cache[key] = result
+        return result
+
+    def _build_layout(self) -> Tuple[int, ...]:
+        """Precompute the scaled pixel values indexed by L"""
+        sx, sy, s = self.scale_x, self.scale_y, self.scale
+        table = [0] * len(L)
+        table[L.X5] = int(5 * sx)
+        table[L.X10] = int(10 * sx)
+        table[L.X12] = int(12 * sx)
+        table[L.X15] = int(15 * sx)
+        table[L.X20] = int(20 * sx)
+        table[L.X30] = int(30 * sx)
+        table[L.X35] = int(35 * sx)
+        table[L.X40] = int(40 * sx)
+        table[L.X50] = int(50 * sx)
+        table[L.X60] = int(60 * sx)
+        table[L.X80] = int(80 * sx)
+        table[L.X100] = int(100 * sx)
+        table[L.X110] = int(110 * sx)
+        table[L.X120] = int(120 * sx)
+        table[L.X130] = int(130 * sx)
+        table[L.X140] = int(140 * sx)
+        table[L.X200] = int(200 * sx)
+        table[L.X210] = int(210 * sx)
+        table[L.X220] = int(220 * sx)
+        table[L.X250] = int(250 * sx)
+        table[L.X500] = int(500 * sx)
+        table[L.X600] = int(600 * sx)
+        table[L.X700] = int(700 * sx)
+        table[L.X720] = int(720 * sx)
+        table[L.X800] = int(800 * sx)
+        table[L.X820] = int(820 * sx)
+        table[L.X920] = int(920 * sx)
+        table[L.Y5] = int(5 * sy)
+        table[L.Y6] = int(6 * sy)
+        table[L.Y8] = int(8 * sy)
+        table[L.Y10] = int(10 * sy)
+        table[L.Y12] = int(12 * sy)
+        table[L.Y15] = int(15 * sy)
+        table[L.Y20] = int(20 * sy)
+        table[L.Y30] = int(30 * sy)
+        table[L.Y35] = int(35 * sy)
+        table[L.Y38] = int(38 * sy)
+        table[L.Y40] = int(40 * sy)
+        table[L.Y45] = int(45 * sy)
+        table[L.Y50] = int(50 * sy)
+        table[L.Y55] = int(55 * sy)
+        table[L.Y60] = int(60 * sy)
+        table[L.Y70] = int(70 * sy)
+        table[L.Y75] = int(75 * sy)
+        table[L.Y80] = int(80 * sy)
+        table[L.Y85] = int(85 * sy)
+        table[L.Y400] = int(400 * sy)
+        table[L.S4] = int(4 * s)
+        table[L.S5] = int(5 * s)
+        table[L.S8] = int(8 * s)
+        table[L.S10] = int(10 * s)
+        table[L.S28] = int(28 * s)
+        table[L.S100] = int(100 * s)
+        table[L.S120] = int(120 * s)
+        return tuple(table)
+
+    def load_categories(self) -> Tuple[Category, ...]:
         """Load forum categories"""
-        return [
-            {
-                'id': 'welcome',
-                'name': 'Bienvenue & Regles',
-                'description': 'Nouvelles recrues, commencez ici',
-                'threads': 12,
-                'posts': 156,
-                'icon': '[i]'
-            },
-            {
-                'id': 'network_security',
-                'name': 'Securite Reseau',
-                'description': 'Firewalls, IDS, architecture reseau',
-                'threads': 89,
-                'posts': 1247,
-                'icon': '[S]'
-            },
-            {
-                'id': 'pentesting',
-                'name': 'Pentest & Red Team',
-                'description': 'Tests d\'intrusion, exploits, CTF',
-                'threads': 156,
-                'posts': 3421,
-                'icon': '[P]'
-            },
-            {
-                'id': 'crypto',
-                'name': 'Cryptographie',
-                'description': 'Chiffrement, hash, steganographie',
-                'threads': 67,
-                'posts': 892,
-                'icon': '[C]'
-            },
-            {
-                'id': 'malware',
-                'name': 'Analyse Malware',
-                'description': 'Reverse engineering, sandboxing',
-                'threads': 134,
-                'posts': 2103,
-                'icon': '[M]'
-            },
-            {
-                'id': 'resources',
-                'name': 'Ressources & Tutos',
-                'description': 'Guides, outils, documentation',
-                'threads': 203,
-                'posts': 4567,
-                'icon': '[R]'
-            },
-            {
-                'id': 'marketplace',
-                'name': 'Marketplace',
-                'description': 'Echange de services et outils',
-                'threads': 78,
-                'posts': 945,
-                'icon': '[$]'
-            },
-            {
-                'id': 'offtopic',
-                'name': 'Off-Topic',
-                'description': 'Discussion generale',
-                'threads': 234,
-                'posts': 5123,
-                'icon': '[O]'
-            }
-        ]
+        return CATEGORIES
 
     def load_threads(self) -> Dict[str, List[ForumThread]]:
         """Load forum threads by category"""
@@ -262,27 +662,30 @@ class ForumBrowser:
 
         # Other categories (empty for now)
         for cat in self.categories:
-            if cat['id'] not in threads:
-                threads[cat['id']] = []
+            if cat.id not in threads:
+                threads[cat.id] = []
 
         return threads
 
     def draw_browser_chrome(self):
         """Draw browser window chrome"""
+        # Single mouse read for both hover checks below - the position
+        # cannot change within one frame
+        mouse_pos = self._mouse_pos
+
         # Browser top bar
         pygame.draw.rect(self.screen, self.browser_bar,
                         (0, 0, self.screen_width, self.browser_bar_height))
 
         # Retour Button (Top Right)
-        button_width = int(100 * self.scale_x)
-        button_height = int(30 * self.scale_y)
-        self.exit_button_rect = pygame.Rect(self.screen_width - button_width - int(15 * self.scale_x), (self.browser_bar_height - button_height) // 2, button_width, button_height)
-        
-        mouse_pos = pygame.mouse.get_pos()
+        button_width = self._layout[L.X100]
+        button_height = self._layout[L.Y30]
+        self.exit_button_rect = pygame.Rect(self.screen_width - button_width - self._layout[L.X15], (self.browser_bar_height - button_height) // 2, button_width, button_height)
+
         is_hovered = self.exit_button_rect.collidepoint(mouse_pos)
-        back_color = (200, 60, 60) if is_hovered else (160, 40, 40)
-        
-        pygame.draw.rect(self.screen, back_color, self.exit_button_rect, border_radius=int(5 * self.scale))
+        retour_bg = (200, 60, 60) if is_hovered else (160, 40, 40)
+
+        self._blit_round_rect(retour_bg, self.exit_button_rect, self._layout[L.S5])
         
         back_text = self.small_font.render("RETOUR", True, (255, 255, 255))
         back_text_rect = back_text.get_rect(center=self.exit_button_rect.center)
@@ -294,18 +697,17 @@ class ForumBrowser:
                         (0, url_bar_y, self.screen_width, self.url_bar_height))
 
         # Back button (left of URL bar)
-        back_button_size = int(28 * self.scale)
-        back_button_x = int(15 * self.scale_x)
+        back_button_size = self._layout[L.S28]
+        back_button_x = self._layout[L.X15]
         back_button_y = url_bar_y + (self.url_bar_height - back_button_size) // 2
         self.back_button_rect = pygame.Rect(back_button_x, back_button_y, back_button_size, back_button_size)
 
         # Check if back button is hovered
-        mouse_pos = pygame.mouse.get_pos()
         is_back_hovered = self.back_button_rect.collidepoint(mouse_pos)
 
         # Draw back button
-        back_color = self.button_hover if is_back_hovered else self.button_bg
-        pygame.draw.rect(self.screen, back_color, self.back_button_rect, border_radius=int(4 * self.scale))
+        url_back_bg = self.button_hover if is_back_hovered else self.button_bg
+        self._blit_round_rect(url_back_bg, self.back_button_rect, self._layout[L.S4])
 
         # Back arrow
         arrow_text = self.body_font.render("<", True, self.text_color)
@@ -313,54 +715,53 @@ class ForumBrowser:
         self.screen.blit(arrow_text, arrow_rect)
 
         # Forward button (right of back button, but disabled)
-        forward_button_x = back_button_x + back_button_size + int(5 * self.scale_x)
+        forward_button_x = back_button_x + back_button_size + self._layout[L.X5]
         forward_button_rect = pygame.Rect(forward_button_x, back_button_y, back_button_size, back_button_size)
-        pygame.draw.rect(self.screen, self.button_bg, forward_button_rect, border_radius=int(4 * self.scale))
+        self._blit_round_rect(self.button_bg, forward_button_rect, self._layout[L.S4])
         forward_text = self.body_font.render(">", True, self.text_dim)
         forward_rect = forward_text.get_rect(center=forward_button_rect.center)
         self.screen.blit(forward_text, forward_rect)
 
         url_box_rect = pygame.Rect(
-            int(130 * self.scale_x),  # Moved right to make room for buttons
-            url_bar_y + int(6 * self.scale_y),
-            self.screen_width - int(210 * self.scale_x),
-            self.url_bar_height - int(12 * self.scale_y)
+            self._layout[L.X130],  # Moved right to make room for buttons
+            url_bar_y + self._layout[L.Y6],
+            self.screen_width - self._layout[L.X210],
+            self.url_bar_height - self._layout[L.Y12]
         )
-        pygame.draw.rect(self.screen, self.content_bg, url_box_rect, border_radius=int(4 * self.scale))
+        self._blit_round_rect(self.content_bg, url_box_rect, self._layout[L.S4])
 
         # Onion URL
         url_text = self.url_font.render("http://cxh3r0f0rum7k2j9d.onion/board", True, self.text_color)
-        self.screen.blit(url_text, (url_box_rect.x + int(10 * self.scale_x),
-                                    url_box_rect.centery - url_text.get_height() // 2))
+        self.screen.blit(url_text, (url_box_rect.x + self._layout[L.X10],
+                                    url_box_rect.centery - self._url_line_h // 2))
 
         # Tor lock icon (before URL bar)
-        lock_x = int(110 * self.scale_x)
+        lock_x = self._layout[L.X110]
         lock_text = self.small_font.render("[TOR]", True, self.primary_color)
         self.screen.blit(lock_text, (lock_x - lock_text.get_width() // 2,
-                                     url_bar_y + self.url_bar_height // 2 - lock_text.get_height() // 2))
+                                     url_bar_y + self.url_bar_height // 2 - self._small_line_h // 2))
 
     def draw_top_navigation(self):
         """Draw forum navigation bar with PROFILE, FORUM, MARKET tabs"""
         nav_y = self.browser_bar_height + self.url_bar_height
         pygame.draw.rect(self.screen, self.post_bg,
                         (0, nav_y, self.screen_width, self.top_bar_height))
-        pygame.draw.line(self.screen, self.border_color,
-                        (0, nav_y + self.top_bar_height),
-                        (self.screen_width, nav_y + self.top_bar_height), 1)
+        self.screen.fill(self.border_color,
+                         (0, nav_y + self.top_bar_height, self.screen_width, 1))
 
         # Forum title (smaller to make room for tabs)
-        title_x = int(30 * self.scale_x)
+        title_x = self._layout[L.X30]
         title = self.body_font.render("CYBER HERO", True, self.primary_color)
-        self.screen.blit(title, (title_x, nav_y + self.top_bar_height // 2 - title.get_height() // 2))
+        self.screen.blit(title, (title_x, nav_y + self.top_bar_height // 2 - self._body_line_h // 2))
 
         # Navigation tabs: PROFILE, FORUM, MARKET
-        tab_start_x = int(250 * self.scale_x)
-        tab_width = int(120 * self.scale_x)
-        tab_height = int(40 * self.scale_y)
-        tab_spacing = int(15 * self.scale_x)
+        tab_start_x = self._layout[L.X250]
+        tab_width = self._layout[L.X120]
+        tab_height = self._layout[L.Y40]
+        tab_spacing = self._layout[L.X15]
         tab_y = nav_y + (self.top_bar_height - tab_height) // 2
 
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self._mouse_pos
 
         # Define tabs
         tabs = [
@@ -370,10 +771,6 @@ class ForumBrowser:
             ("EMAIL", "email")
         ]
 
-        # Store tab rectangles for click detection
-        if not hasattr(self, 'nav_tab_rects'):
-            self.nav_tab_rects = {}
-
         for i, (tab_name, tab_id) in enumerate(tabs):
             tab_x = tab_start_x + i * (tab_width + tab_spacing)
             tab_rect = pygame.Rect(tab_x, tab_y, tab_width, tab_height)
@@ -396,13 +793,13 @@ class ForumBrowser:
                 tab_bg_color = (20, 20, 25)
                 text_color = self.dim_text
 
-            pygame.draw.rect(self.screen, tab_bg_color, tab_rect, border_radius=int(5 * self.scale))
+            self._blit_round_rect(tab_bg_color, tab_rect, self._layout[L.S5])
 
             # Draw tab border
             if is_active:
-                pygame.draw.rect(self.screen, self.primary_color, tab_rect, width=2, border_radius=int(5 * self.scale))
+                self._blit_round_rect(self.primary_color, tab_rect, self._layout[L.S5], width=2)
             else:
-                pygame.draw.rect(self.screen, self.border_color, tab_rect, width=1, border_radius=int(5 * self.scale))
+                self._blit_round_rect(self.border_color, tab_rect, self._layout[L.S5], width=1)
 
             # Draw tab text
             tab_text_surf = self.small_font.render(tab_name, True, text_color)
@@ -410,12 +807,12 @@ class ForumBrowser:
             self.screen.blit(tab_text_surf, tab_text_rect)
 
         # User info (right side)
-        user_x = self.screen_width - int(220 * self.scale_x)
+        user_x = self.screen_width - self._layout[L.X220]
         if self.logged_in and self.username:
             user_text = self.small_font.render(f"[{self.username}]", True, self.primary_color)
         else:
             user_text = self.small_font.render("[Invite]", True, self.dim_text)
-        self.screen.blit(user_text, (user_x, nav_y + self.top_bar_height // 2 - user_text.get_height() // 2))
+        self.screen.blit(user_text, (user_x, nav_y + self.top_bar_height // 2 - self._small_line_h // 2))
 
     def draw_back_button(self, x: int, y: int, text: str = "< Retour") -> pygame.Rect:
         """
@@ -434,12 +831,12 @@ class ForumBrowser:
         button_rect = pygame.Rect(x, y, button_width, button_height)
 
         # Hover effect
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self._mouse_pos
         is_hovered = button_rect.collidepoint(mouse_pos)
 
         bg_color = self.button_hover if is_hovered else self.button_bg
-        pygame.draw.rect(self.screen, bg_color, button_rect, border_radius=int(4 * self.scale))
-        pygame.draw.rect(self.screen, self.border_color, button_rect, width=1, border_radius=int(4 * self.scale))
+        self._blit_round_rect(bg_color, button_rect, self._layout[L.S4])
+        self._blit_round_rect(self.border_color, button_rect, self._layout[L.S4], width=1)
 
         # Button text
         text_surface = self.body_font.render(text, True, self.text_color)
@@ -463,8 +860,8 @@ class ForumBrowser:
         box_height = int(450 * self.scale_y)
         box_rect = pygame.Rect(content_x, content_y, box_width, box_height)
 
-        pygame.draw.rect(self.screen, self.post_bg, box_rect, border_radius=int(10 * self.scale))
-        pygame.draw.rect(self.screen, self.border_color, box_rect, 2, border_radius=int(10 * self.scale))
+        self._blit_round_rect(self.post_bg, box_rect, int(10 * self.scale))
+        self._blit_round_rect(self.border_color, box_rect, int(10 * self.scale), width=2)
 
         # Title
         title_y = content_y + int(40 * self.scale_y)
@@ -480,9 +877,9 @@ class ForumBrowser:
 
         # Divider
         divider_y = subtitle_rect.bottom + int(30 * self.scale_y)
-        pygame.draw.line(self.screen, self.border_color,
-                        (content_x + int(50 * self.scale_x), divider_y),
-                        (content_x + box_width - int(50 * self.scale_x), divider_y), 1)
+        self.screen.fill(self.border_color,
+                         (content_x + int(50 * self.scale_x), divider_y,
+                          box_width - int(100 * self.scale_x), 1))
 
         # Welcome message
         message_y = divider_y + int(30 * self.scale_y)
@@ -514,11 +911,11 @@ class ForumBrowser:
         register_x = self.screen_width // 2 - button_width - button_spacing // 2
         self.register_button_rect = pygame.Rect(register_x, button_y, button_width, button_height)
 
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self._mouse_pos
         is_register_hovered = self.register_button_rect.collidepoint(mouse_pos)
 
         register_color = (0, 240, 60) if is_register_hovered else self.primary_color
-        pygame.draw.rect(self.screen, register_color, self.register_button_rect, border_radius=int(6 * self.scale))
+        self._blit_round_rect(register_color, self.register_button_rect, int(6 * self.scale))
 
         register_text = self.heading_font.render("CREER UN COMPTE", True, (0, 0, 0))
         register_text_rect = register_text.get_rect(center=self.register_button_rect.center)
@@ -531,8 +928,8 @@ class ForumBrowser:
         is_login_hovered = self.login_button_rect.collidepoint(mouse_pos)
 
         login_bg = (35, 35, 35) if is_login_hovered else (25, 25, 25)
-        pygame.draw.rect(self.screen, login_bg, self.login_button_rect, border_radius=int(6 * self.scale))
-        pygame.draw.rect(self.screen, self.border_color, self.login_button_rect, 2, border_radius=int(6 * self.scale))
+        self._blit_round_rect(login_bg, self.login_button_rect, int(6 * self.scale))
+        self._blit_round_rect(self.border_color, self.login_button_rect, int(6 * self.scale), width=2)
 
         login_text = self.heading_font.render("SE CONNECTER", True, self.text_color)
         login_text_rect = login_text.get_rect(center=self.login_button_rect.center)
@@ -564,45 +961,49 @@ class ForumBrowser:
             title_y = content_y
 
         # Page title
-        title = self.title_font.render("Catégories du Forum", True, self.primary_color)
+        title = self._render_cached(self.title_font, "Catégories du Forum", self.primary_color)
         self.screen.blit(title, (content_x, title_y))
 
         # Category list
         category_y = title_y + int(50 * self.scale_y)
         self.category_rects = {}
+        box_height = int(80 * self.scale_y)
+        row_step = box_height + int(10 * self.scale_y)
+        self._category_hit = (content_x, content_width, category_y,
+                              box_height, row_step,
+                              tuple(c.id for c in self.categories))
+        mouse_pos = self._mouse_pos
 
         for category in self.categories:
             # Category box
-            box_height = int(80 * self.scale_y)
             box_rect = pygame.Rect(content_x, category_y, content_width, box_height)
-            self.category_rects[category['id']] = box_rect
+            self.category_rects[category.id] = box_rect
 
             # Hover effect
-            mouse_pos = pygame.mouse.get_pos()
             is_hovered = box_rect.collidepoint(mouse_pos)
             bg_color = self.post_bg if is_hovered else self.content_bg
 
-            pygame.draw.rect(self.screen, bg_color, box_rect, border_radius=int(5 * self.scale))
-            pygame.draw.rect(self.screen, self.border_color, box_rect, 1, border_radius=int(5 * self.scale))
+            self._blit_round_rect(bg_color, box_rect, self._layout[L.S5])
+            self._blit_round_rect(self.border_color, box_rect, self._layout[L.S5], width=1)
 
             # Icon
             icon_x = box_rect.x + int(20 * self.scale_x)
-            icon_text = self.heading_font.render(category['icon'], True, self.primary_color)
-            self.screen.blit(icon_text, (icon_x, box_rect.centery - icon_text.get_height() // 2))
+            icon_text = self._render_cached(self.heading_font, category.icon, self.primary_color)
+            self.screen.blit(icon_text, (icon_x, box_rect.centery - self._heading_line_h // 2))
 
             # Category name
             name_x = icon_x + int(50 * self.scale_x)
-            name_text = self.heading_font.render(category['name'], True, self.primary_color if is_hovered else self.text_color)
+            name_text = self._render_cached(self.heading_font, category.name, self.primary_color if is_hovered else self.text_color)
             self.screen.blit(name_text, (name_x, box_rect.y + int(15 * self.scale_y)))
 
             # Description
-            desc_text = self.small_font.render(category['description'], True, self.dim_text)
+            desc_text = self._render_cached(self.small_font, category.description, self.dim_text)
             self.screen.blit(desc_text, (name_x, box_rect.y + int(42 * self.scale_y)))
 
             # Stats (right side)
             stats_x = box_rect.right - int(200 * self.scale_x)
-            threads_text = self.small_font.render(f"Sujets: {category['threads']}", True, self.text_color)
-            posts_text = self.small_font.render(f"Messages: {category['posts']}", True, self.dim_text)
+            threads_text = self._render_cached(self.small_font, f"Sujets: {category.threads}", self.text_color)
+            posts_text = self._render_cached(self.small_font, f"Messages: {category.posts}", self.dim_text)
             self.screen.blit(threads_text, (stats_x, box_rect.y + int(20 * self.scale_y)))
             self.screen.blit(posts_text, (stats_x, box_rect.y + int(45 * self.scale_y)))
 
@@ -610,539 +1011,309 @@ class ForumBrowser:
 
         # Instructions
         instructions_y = self.screen_height - int(35 * self.scale_y)
-        instructions = self.small_font.render("ECHAP: Retour | CLIC: Ouvrir categorie", True, self.dim_text)
+        instructions = self._render_cached(self.small_font, "ECHAP: Retour | CLIC: Ouvrir categorie", self.dim_text)
         self.screen.blit(instructions, (content_x, instructions_y))
 
     def draw_threads_page(self):
         """Draw threads listing for selected category"""
-        category = next((c for c in self.categories if c['id'] == self.selected_category), None)
+        category = next((c for c in self.categories if c.id == self.selected_category), None)
         if not category:
             return
 
-        content_y = self.browser_bar_height + self.url_bar_height + self.top_bar_height + int(20 * self.scale_y)
-        content_x = int(40 * self.scale_x)
-        content_width = self.screen_width - int(80 * self.scale_x)
+        content_y = self.browser_bar_height + self.url_bar_height + self.top_bar_height + self._layout[L.Y20]
+        content_x = self._layout[L.X40]
+        content_width = self.screen_width - self._layout[L.X80]
 
         # Back button
         self.threads_back_button = self.draw_back_button(content_x, content_y, "< Categories")
-        header_y = content_y + int(50 * self.scale_y)
+        header_y = content_y + self._layout[L.Y50]
 
         # Category header
-        header = self.title_font.render(f"{category['icon']} {category['name']}", True, self.primary_color)
+        header = self._render_cached(self.title_font, f"{category.icon} {category.name}", self.primary_color)
         self.screen.blit(header, (content_x, header_y))
 
-        desc = self.small_font.render(category['description'], True, self.dim_text)
-        self.screen.blit(desc, (content_x, header_y + int(35 * self.scale_y)))
+        desc = self._render_cached(self.small_font, category.description, self.dim_text)
+        self.screen.blit(desc, (content_x, header_y + self._layout[L.Y35]))
 
         # Thread list header
-        list_y = header_y + int(80 * self.scale_y)
-        header_rect = pygame.Rect(content_x, list_y, content_width, int(30 * self.scale_y))
-        pygame.draw.rect(self.screen, self.post_bg, header_rect)
+        list_y = header_y + self._layout[L.Y80]
+        pygame.draw.rect(self.screen, self.post_bg,
+                         (content_x, list_y, content_width, self._layout[L.Y30]))
 
         # Column headers
-        col_title = self.small_font.render("SUJET", True, self.accent_color)
-        col_author = self.small_font.render("AUTEUR", True, self.accent_color)
-        col_replies = self.small_font.render("REP.", True, self.accent_color)
-        col_views = self.small_font.render("VUES", True, self.accent_color)
-        col_last = self.small_font.render("DERNIER MESSAGE", True, self.accent_color)
-
-        self.screen.blit(col_title, (content_x + int(20 * self.scale_x), list_y + int(8 * self.scale_y)))
-        self.screen.blit(col_author, (content_x + int(500 * self.scale_x), list_y + int(8 * self.scale_y)))
-        self.screen.blit(col_replies, (content_x + int(700 * self.scale_x), list_y + int(8 * self.scale_y)))
-        self.screen.blit(col_views, (content_x + int(800 * self.scale_x), list_y + int(8 * self.scale_y)))
-        self.screen.blit(col_last, (content_x + int(920 * self.scale_x), list_y + int(8 * self.scale_y)))
+        col_title = self._render_cached(self.small_font, "SUJET", self.accent_color)
+        col_author = self._render_cached(self.small_font, "AUTEUR", self.accent_color)
+        col_replies = self._render_cached(self.small_font, "REP.", self.accent_color)
+        col_views = self._render_cached(self.small_font, "VUES", self.accent_color)
+        col_last = self._render_cached(self.small_font, "DERNIER MESSAGE", self.accent_color)
+
+        self.screen.blit(col_title, (content_x + self._layout[L.X20], list_y + self._layout[L.Y8]))
+        self.screen.blit(col_author, (content_x + self._layout[L.X500], list_y + self._layout[L.Y8]))
+        self.screen.blit(col_replies, (content_x + self._layout[L.X700], list_y + self._layout[L.Y8]))
+        self.screen.blit(col_views, (content_x + self._layout[L.X800], list_y + self._layout[L.Y8]))
+        self.screen.blit(col_last, (content_x + self._layout[L.X920], list_y + self._layout[L.Y8]))
 
         # Thread list
-        thread_y = list_y + int(35 * self.scale_y)
+        list_top = list_y + self._layout[L.Y35]
         self.thread_rects = {}
 
         threads = self.threads.get(self.selected_category, [])
 
-        for thread in threads:
-            row_height = int(50 * self.scale_y)
+        # Viewport culling: only render the rows that can appear on screen,
+        # so work stays O(visible) instead of O(total threads)
+        row_height = self._layout[L.Y50]
+        visible_rows = max(0, (self.screen_height - list_top) // row_height + 1)
+        first_visible = max(0, self.scroll_offset // row_height)
+        last_visible = min(len(threads), first_visible + visible_rows + 1)
+
+        self._thread_hit = (content_x, content_width, list_top, row_height,
+                            first_visible, last_visible,
+                            tuple(t.id for t in threads))
+
+        row_blits = []
+        mouse_pos = self._mouse_pos
+        for k, thread in enumerate(threads[first_visible:last_visible]):
+            thread_y = list_top + (first_visible + k) * row_height - self.scroll_offset
             row_rect = pygame.Rect(content_x, thread_y, content_width, row_height)
             self.thread_rects[thread.id] = row_rect
 
             # Hover effect
-            mouse_pos = pygame.mouse.get_pos()
             is_hovered = row_rect.collidepoint(mouse_pos)
             bg_color = self.border_color if is_hovered else self.content_bg
 
             pygame.draw.rect(self.screen, bg_color, row_rect)
-            pygame.draw.line(self.screen, self.border_color,
-                           (content_x, thread_y + row_height),
-                           (content_x + content_width, thread_y + row_height), 1)
+            self.screen.fill(self.border_color,
+                             (content_x, thread_y + row_height, content_width, 1))
 
             # Thread title
             title_color = self.pinned_color if thread.pinned else (self.link_color if is_hovered else self.text_color)
             prefix = "📌 " if thread.pinned else ""
-            title_text = self.body_font.render(f"{prefix}{thread.title[:60]}", True, title_color)
-            self.screen.blit(title_text, (row_rect.x + int(20 * self.scale_x),
-                                         row_rect.centery - title_text.get_height() // 2))
+            title_text = self._render_cached(self.body_font, f"{prefix}{thread.title[:60]}", title_color)
+            row_blits.append((title_text, (row_rect.x + self._layout[L.X20],
+                                           row_rect.centery - self._body_line_h // 2)))
 
             # Author
-            author_text = self.small_font.render(thread.author, True, self.dim_text)
-            self.screen.blit(author_text, (content_x + int(500 * self.scale_x),
-                                          row_rect.centery - author_text.get_height() // 2))
+            author_text = self._render_cached(self.small_font, thread.author, self.dim_text)
+            row_blits.append((author_text, (content_x + self._layout[L.X500],
+                                            row_rect.centery - self._small_line_h // 2)))
 
             # Replies
-            replies_text = self.small_font.render(str(thread.replies), True, self.dim_text)
-            self.screen.blit(replies_text, (content_x + int(720 * self.scale_x),
-                                           row_rect.centery - replies_text.get_height() // 2))
+            replies_text = self._render_cached(self.small_font, str(thread.replies), self.dim_text)
+            row_blits.append((replies_text, (content_x + self._layout[L.X720],
+                                             row_rect.centery - self._small_line_h // 2)))
 
             # Views
-            views_text = self.small_font.render(str(thread.views), True, self.dim_text)
-            self.screen.blit(views_text, (content_x + int(820 * self.scale_x),
-                                         row_rect.centery - views_text.get_height() // 2))
+            views_text = self._render_cached(self.small_font, str(thread.views), self.dim_text)
+            row_blits.append((views_text, (content_x + self._layout[L.X820],
+                                           row_rect.centery - self._small_line_h // 2)))
 
             # Last post
-            last_text = self.small_font.render(thread.last_post, True, self.dim_text)
-            self.screen.blit(last_text, (content_x + int(920 * self.scale_x),
-                                        row_rect.centery - last_text.get_height() // 2))
+            last_text = self._render_cached(self.small_font, thread.last_post, self.dim_text)
+            row_blits.append((last_text, (content_x + self._layout[L.X920],
+                                          row_rect.centery - self._small_line_h // 2)))
 
-            thread_y += row_height
+        # One Python->C transition for all row text instead of five per row
+        if row_blits:
+            self.screen.blits(row_blits, doreturn=0)
 
         # Instructions
-        instructions_y = self.screen_height - int(35 * self.scale_y)
-        instructions = self.small_font.render("ECHAP: Retour aux categories | CLIC: Ouvrir sujet", True, self.dim_text)
+        instructions_y = self.screen_height - self._layout[L.Y35]
+        instructions = self._render_cached(self.small_font, "ECHAP: Retour aux categories | CLIC: Ouvrir sujet", self.dim_text)
         self.screen.blit(instructions, (content_x, instructions_y))
 
+    def _build_market_row(self, tool: "ToolSpec", state: str,
+                          width: int, height: int) -> pygame.Surface:
+        """Render a full non-interactive market row (bg, border, texts,
+        status button) onto one reusable surface"""
+        row = pygame.Surface((width, height), pygame.SRCALPHA)
+        radius = self._layout[L.S8]
+
+        pygame.draw.rect(row, self.post_bg, (0, 0, width, height), border_radius=radius)
+        if state == "downloaded":
+            border_col = (0, 200, 100)
+        elif state == "nofunds":
+            border_col = self.primary_color
+        else:
+            border_col = (80, 80, 90)
+        pygame.draw.rect(row, border_col, (0, 0, width, height), width=2, border_radius=radius)
+
+        icon_x = self._layout[L.X20]
+        icon_text = self._render_cached(self.title_font, tool.icon, self.text_color)
+        row.blit(icon_text, (icon_x, height // 2 - self._title_line_h // 2))
+
+        name_x = icon_x + self._layout[L.X50]
+        row.blit(self._render_cached(self.heading_font, tool.name, self.text_bright),
+                 (name_x, self._layout[L.Y12]))
+        row.blit(self._render_cached(self.small_font, tool.description, self.text_dim),
+                 (name_x, self._layout[L.Y38]))
+        row.blit(self._render_cached(self.small_font, tool.display_size_price, self.text_dim),
+                 (name_x, self._layout[L.Y55]))
+
+        btn_width = self._layout[L.X140]
+        btn_height = self._layout[L.Y35]
+        btn_rect = pygame.Rect(width - btn_width - self._layout[L.X15],
+                               height // 2 - btn_height // 2, btn_width, btn_height)
+        if state == "downloaded":
+            btn_color, btn_text = (0, 100, 50), self._render_cached(self.small_font, "INSTALLE", (0, 200, 100))
+        elif state == "nofunds":
+            btn_color, btn_text = (100, 50, 50), self._render_cached(self.small_font, "FUNDS", (255, 200, 200))
+        else:
+            btn_color, btn_text = (50, 50, 55), self._render_cached(self.small_font, "VERROUILLE", (100, 100, 110))
+        pygame.draw.rect(row, btn_color, btn_rect, border_radius=self._layout[L.S4])
+        row.blit(btn_text, btn_text.get_rect(center=btn_rect.center))
+        return row
+
     def draw_market_page(self):
         """Draw marketplace page"""
-        content_y = self.browser_bar_height + self.url_bar_height + self.top_bar_height + int(20 * self.scale_y)
-        content_x = int(40 * self.scale_x)
-        content_width = self.screen_width - int(80 * self.scale_x)
+        content_y = self.browser_bar_height + self.url_bar_height + self.top_bar_height + self._layout[L.Y20]
+        content_x = self._layout[L.X40]
+        content_width = self.screen_width - self._layout[L.X80]
 
         # Back button
         self.market_back_button = self.draw_back_button(content_x, content_y, "< Categories")
-        header_y = content_y + int(50 * self.scale_y)
+        header_y = content_y + self._layout[L.Y50]
 
         # Market header
-        header = self.title_font.render("🛒 MARKETPLACE", True, self.primary_color)
+        header = self._render_cached(self.title_font, "🛒 MARKETPLACE", self.primary_color)
         self.screen.blit(header, (content_x, header_y))
 
-        desc_y = header_y + int(45 * self.scale_y)
-        desc = self.body_font.render("Telechargez des outils pour vos missions de hacking.", True, self.text_dim)
+        desc_y = header_y + self._layout[L.Y45]
+        desc = self._render_cached(self.body_font, "Telechargez des outils pour vos missions de hacking.", self.text_dim)
         self.screen.blit(desc, (content_x, desc_y))
 
-        # Initialize market tool rects if not exists
-        if not hasattr(self, 'market_tool_rects'):
-            self.market_tool_rects = {}
-
         # Get downloaded tools from profile
         downloaded_tools = self.profile_data.get('downloaded_tools', [])
 
         # Check which mission is completed to determine downloadable tools
         progress = self.profile_data.get('progress', {})
         missions_completed = progress.get('missions_completed', [])
-        mission1_done = 'mission1' in missions_completed or progress.get('mission1_completed', False)
-        mission2_done = 'mission2' in missions_completed
-
-        # Available tools in market
-        market_tools = [
-            {
-                "id": "wireshark",
-                "name": "Wireshark",
-                "icon": "W",
-                "description": "Analyseur de paquets reseau professionnel",
-                "size": "45.2 MB",
-                "price": 300,  # Updated price
-                "downloadable": mission1_done,  # Available after Mission 1
-                "required_mission": "mission2"
-            },
-            {
-                "id": "pcap_analyzer",
-                "name": "PCAP Analyzer",
-                "icon": "P",
-                "description": "Analyseur de fichiers capture (hex dump)",
-                "size": "8.5 MB",
-                "price": 400,  # Updated price
-                "downloadable": mission2_done,  # Available after Mission 2
-                "required_mission": "mission3"
-            },
-            {
-                "id": "nmap_pro",
-                "name": "Nmap Pro",
-                "icon": "N",
-                "description": "Scanner de ports et vulnerabilites avance",
-                "size": "12.8 MB",
-                "price": 150,
-                "downloadable": False,
-                "required_mission": "mission4"
-            },
-            {
-                "id": "metasploit",
-                "name": "Metasploit Framework",
-                "icon": "M",
-                "description": "Framework d'exploitation et pentest",
-                "size": "234.5 MB",
-                "price": 0,
-                "downloadable": False,
-                "required_mission": "mission5"
-            },
-            {
-                "id": "burpsuite",
-                "name": "Burp Suite",
-                "icon": "B",
-                "description": "Proxy d'interception HTTP/HTTPS",
-                "size": "89.1 MB",
-                "price": 0,
-                "downloadable": False,
-                "required_mission": "mission6"
-            },
-            {
-                "id": "hashcat",
-                "name": "Hashcat",
-                "icon": "H",
-                "description": "Cracker de mots de passe GPU",
-                "size": "28.4 MB",
-                "price": 0,
-                "downloadable": False,
-                "required_mission": "mission7"
-            },
-        ]
+        mission_done = {
+            "mission1": 'mission1' in missions_completed or progress.get('mission1_completed', False),
+            "mission2": 'mission2' in missions_completed,
+        }
 
         # Draw tools list
-        tools_y = desc_y + int(50 * self.scale_y)
+        tools_y = desc_y + self._layout[L.Y50]
         self.market_tool_rects = {}
-        
+        tool_blits = []
+        mouse_pos = self._mouse_pos
+
         # Get player credits
         player_credits = self.profile_data.get('progress', {}).get('credits', 0)
 
-        for i, tool in enumerate(market_tools):
-            tool_y = tools_y + (i * int(85 * self.scale_y))
-            tool_height = int(75 * self.scale_y)
+        for i, tool in enumerate(_MARKET_TOOLS):
+            tool_y = tools_y + (i * self._layout[L.Y85])
+            tool_height = self._layout[L.Y75]
             tool_rect = pygame.Rect(content_x, tool_y, content_width, tool_height)
 
             # Check if already downloaded
-            is_downloaded = tool['id'] in downloaded_tools
+            is_downloaded = tool.id in downloaded_tools
+            downloadable = mission_done.get(tool.unlocked_by, False)
 
-            # Hover effect
-            mouse_pos = pygame.mouse.get_pos()
+            if is_downloaded:
+                state = "downloaded"
+            elif downloadable:
+                state = "buy" if player_credits >= tool.price else "nofunds"
+            else:
+                state = "locked"
+
+            # Non-interactive rows never change: blit the prebuilt surface
+            # (one call instead of ~8 rect/text draws) unless hovered
             is_hovered = tool_rect.collidepoint(mouse_pos)
+            if state != "buy" and not is_hovered:
+                row = self._market_row_cache.get((tool.id, state))
+                if row is None:
+                    row = self._build_market_row(tool, state, content_width, tool_height)
+                    self._market_row_cache[(tool.id, state)] = row
+                self.screen.blit(row, tool_rect.topleft)
+                continue
+
             bg_color = self.hover_bg if is_hovered else self.post_bg
 
-            pygame.draw.rect(self.screen, bg_color, tool_rect, border_radius=int(8 * self.scale))
+            pygame.draw.rect(self.screen, bg_color, tool_rect, border_radius=self._layout[L.S8])
 
             # Border color based on status
             if is_downloaded:
                 border_col = (0, 200, 100)  # Green - downloaded
-            elif tool['downloadable']:
+            elif downloadable:
                 border_col = self.primary_color  # Cyan - available
             else:
                 border_col = (80, 80, 90)  # Gray - locked
 
-            pygame.draw.rect(self.screen, border_col, tool_rect, width=2, border_radius=int(8 * self.scale))
+            pygame.draw.rect(self.screen, border_col, tool_rect, width=2, border_radius=self._layout[L.S8])
 
             # Icon
-            icon_x = content_x + int(20 * self.scale_x)
-            icon_text = self.title_font.render(tool['icon'], True, self.text_color)
-            self.screen.blit(icon_text, (icon_x, tool_rect.centery - icon_text.get_height() // 2))
+            icon_x = content_x + self._layout[L.X20]
+            icon_text = self._render_cached(self.title_font, tool.icon, self.text_color)
+            tool_blits.append((icon_text, (icon_x, tool_rect.centery - self._title_line_h // 2)))
 
             # Name and description
-            name_x = icon_x + int(50 * self.scale_x)
-            name_text = self.heading_font.render(tool['name'], True, self.text_bright)
-            self.screen.blit(name_text, (name_x, tool_y + int(12 * self.scale_y)))
+            name_x = icon_x + self._layout[L.X50]
+            name_text = self._render_cached(self.heading_font, tool.name, self.text_bright)
+            tool_blits.append((name_text, (name_x, tool_y + self._layout[L.Y12])))
 
-            desc_text = self.small_font.render(tool['description'], True, self.text_dim)
-            self.screen.blit(desc_text, (name_x, tool_y + int(38 * self.scale_y)))
+            desc_text = self._render_cached(self.small_font, tool.description, self.text_dim)
+            tool_blits.append((desc_text, (name_x, tool_y + self._layout[L.Y38])))
 
-            size_text = self.small_font.render(f"Taille: {tool['size']} | Prix: {tool['price']}$", True, self.text_dim)
-            self.screen.blit(size_text, (name_x, tool_y + int(55 * self.scale_y)))
+            size_text = self._render_cached(self.small_font, tool.display_size_price, self.text_dim)
+            tool_blits.append((size_text, (name_x, tool_y + self._layout[L.Y55])))
 
             # Download button / Status
-            btn_width = int(140 * self.scale_x)
-            btn_height = int(35 * self.scale_y)
-            btn_x = tool_rect.right - btn_width - int(15 * self.scale_x)
+            btn_width = self._layout[L.X140]
+            btn_height = self._layout[L.Y35]
+            btn_x = tool_rect.right - btn_width - self._layout[L.X15]
             btn_y = tool_rect.centery - btn_height // 2
             btn_rect = pygame.Rect(btn_x, btn_y, btn_width, btn_height)
 
             if is_downloaded:
                 # Already downloaded
-                pygame.draw.rect(self.screen, (0, 100, 50), btn_rect, border_radius=int(4 * self.scale))
-                btn_text = self.small_font.render("INSTALLE", True, (0, 200, 100))
-            elif tool['downloadable']:
+                pygame.draw.rect(self.screen, (0, 100, 50), btn_rect, border_radius=self._layout[L.S4])
+                btn_text = self._render_cached(self.small_font, "INSTALLE", (0, 200, 100))
+            elif downloadable:
                 # Can download
-                can_afford = player_credits >= tool['price']
+                can_afford = player_credits >= tool.price
                 if can_afford:
                     btn_hover = btn_rect.collidepoint(mouse_pos)
                     btn_color = (0, 180, 100) if btn_hover else (0, 140, 80)
-                    btn_text = self.small_font.render("ACHETER", True, (255, 255, 255))  # Buy button
-                    self.market_tool_rects[tool['id']] = btn_rect
+                    btn_text = self._render_cached(self.small_font, "ACHETER", (255, 255, 255))  # Buy button
+                    self.market_tool_rects[tool.id] = btn_rect
                 else:
                     btn_color = (100, 50, 50)
-                    btn_text = self.small_font.render("FUNDS", True, (255, 200, 200))
-                pygame.draw.rect(self.screen, btn_color, btn_rect, border_radius=int(4 * self.scale))
+                    btn_text = self._render_cached(self.small_font, "FUNDS", (255, 200, 200))
+                pygame.draw.rect(self.screen, btn_color, btn_rect, border_radius=self._layout[L.S4])
             else:
                 # Locked
-                pygame.draw.rect(self.screen, (50, 50, 55), btn_rect, border_radius=int(4 * self.scale))
-                btn_text = self.small_font.render("VERROUILLE", True, (100, 100, 110))
+                pygame.draw.rect(self.screen, (50, 50, 55), btn_rect, border_radius=self._layout[L.S4])
+                btn_text = self._render_cached(self.small_font, "VERROUILLE", (100, 100, 110))
 
             btn_text_rect = btn_text.get_rect(center=btn_rect.center)
-            self.screen.blit(btn_text, btn_text_rect)
-
-        # Instructions
-        instructions_y = self.screen_height - int(35 * self.scale_y)
-        instructions = self.small_font.render("ESC: Retour aux categories | Cliquez ACHETER pour installer un outil", True, self.dim_text)
-        self.screen.blit(instructions, (content_x, instructions_y))
-
-    def load_emails_from_inbox(self):
-        """Load emails from the inbox system"""
-        from src.ui.inbox import Inbox
-        inbox = Inbox(self.screen, self.profile_data)
-        self.emails = inbox.emails
-
-        # Clear notifications when viewing inbox
-        from src.systems.notification_manager import get_notification_manager
-        notification_manager = get_notification_manager()
-        notification_manager.clear_notification()
-
-    def draw_inbox_page(self):
-        """Draw inbox/email page"""
-        content_y = self.browser_bar_height + self.url_bar_height + self.top_bar_height + int(20 * self.scale_y)
-        content_x = int(40 * self.scale_x)
-        content_width = self.screen_width - int(80 * self.scale_x)
-
-        # Back button
-        self.inbox_back_button = self.draw_back_button(content_x, content_y, "< Forum")
-        header_y = content_y + int(50 * self.scale_y)
-
-        # Header
-        header = self.title_font.render("📧 MESSAGERIE", True, self.primary_color)
-        self.screen.blit(header, (content_x, header_y))
-
-        # Load emails if not already loaded
-        if not self.emails:
-            self.load_emails_from_inbox()
-
-        # Email list
-        list_y = header_y + int(60 * self.scale_y)
-        self.email_rects = {}
-
-        if not self.emails:
-            # No emails message
-            no_email_text = self.body_font.render("Aucun message pour le moment.", True, self.text_dim)
-            self.screen.blit(no_email_text, (content_x, list_y))
-        else:
-            for i, email in enumerate(self.emails):
-                email_height = int(70 * self.scale_y)
-                email_rect = pygame.Rect(content_x, list_y, content_width, email_height)
-                self.email_rects[i] = email_rect
-
-                # Hover/selection effect
-                mouse_pos = pygame.mouse.get_pos()
-                is_hovered = email_rect.collidepoint(mouse_pos)
-                is_selected = (self.selected_email_index == i)
-
-                if is_selected:
-                    bg_color = self.button_hover
-                elif is_hovered:
-                    bg_color = self.hover_bg
-                else:
-                    bg_color = self.post_bg
-
-                pygame.draw.rect(self.screen, bg_color, email_rect, border_radius=int(5 * self.scale))
-                pygame.draw.rect(self.screen, self.border_color, email_rect, width=1, border_radius=int(5 * self.scale))
-
-                # Unread indicator
-                if not email.read:
-                    unread_x = email_rect.x + int(15 * self.scale_x)
-                    unread_y = email_rect.centery
-                    pygame.draw.circle(self.screen, self.primary_color, (unread_x, unread_y), int(5 * self.scale))
+            tool_blits.append((btn_text, btn_text_rect))
 
-                # Email info
-                text_x = content_x + int(35 * self.scale_x)
-
-                # Sender
-                sender_text = self.body_font.render(f"De: {email.sender}", True, self.text_bright if not email.read else self.text_color)
-                self.screen.blit(sender_text, (text_x, email_rect.y + int(10 * self.scale_y)))
-
-                # Subject
-                subject_text = self.body_font.render(email.subject, True, self.text_bright if not email.read else self.text_color)
-                self.screen.blit(subject_text, (text_x, email_rect.y + int(35 * self.scale_y)))
-
-                list_y += email_height + int(10 * self.scale_y)
-
-            # If an email is selected, show its content
-            if self.selected_email_index is not None and 0 <= self.selected_email_index < len(self.emails):
-                self._draw_email_content(content_x, list_y, content_width)
+        # Single batched call for all tool text
+        if tool_blits:
+            self.screen.blits(tool_blits, doreturn=0)
 
         # Instructions
-        instructions_y = self.screen_height - int(35 * self.scale_y)
-        instructions = self.small_font.render("CLIC: Lire l'email | ESC: Retour", True, self.dim_text)
+        instructions_y = self.screen_height - self._layout[L.Y35]
+        instructions = self._render_cached(self.small_font, "ESC: Retour aux categories | Cliquez ACHETER pour installer un outil", self.dim_text)
         self.screen.blit(instructions, (content_x, instructions_y))
 
-    def _draw_email_content(self, content_x: int, start_y: int, content_width: int):
-        """Draw selected email content with scrolling"""
-        if self.selected_email_index is None:
-            return
-
-        email = self.emails[self.selected_email_index]
-
-        # Content panel
-        panel_y = start_y + int(10 * self.scale_y)
-        panel_height = self.screen_height - panel_y - int(60 * self.scale_y)
-        scrollbar_width = int(12 * self.scale_x)
-        panel_rect = pygame.Rect(content_x, panel_y, content_width, panel_height)
-
-        pygame.draw.rect(self.screen, self.content_bg, panel_rect, border_radius=int(8 * self.scale))
-        pygame.draw.rect(self.screen, self.border_color, panel_rect, width=2, border_radius=int(8 * self.scale))
-
-        # Email header (fixed)
-        text_x = content_x + int(20 * self.scale_x)
-        header_y = panel_y + int(20 * self.scale_y)
-
-        from_text = self.body_font.render(f"De: {email.sender}", True, self.primary_color)
-        self.screen.blit(from_text, (text_x, header_y))
-        header_y += from_text.get_height() + int(10 * self.scale_y)
-
-        subject_text = self.heading_font.render(email.subject, True, self.text_bright)
-        self.screen.blit(subject_text, (text_x, header_y))
-        header_y += subject_text.get_height() + int(15 * self.scale_y)
-
-        # Divider
-        pygame.draw.line(self.screen, self.border_color,
-                        (text_x, header_y),
-                        (content_x + content_width - int(20 * self.scale_x), header_y), 1)
-
-        # Scrollable body area
-        body_start_y = header_y + int(15 * self.scale_y)
-        visible_height = panel_y + panel_height - body_start_y - int(20 * self.scale_y)
-        max_width = content_width - int(60 * self.scale_x) - scrollbar_width
-
-        # Calculate total content height
-        body_lines = email.body.split('\n')
-        total_height = 0
-        line_height = self.body_font.get_height() + int(5 * self.scale_y)
-
-        for line in body_lines:
-            if line.strip():
-                words = line.split(' ')
-                current_line = ""
-                for word in words:
-                    test_line = current_line + word + " "
-                    test_surface = self.body_font.render(test_line, True, self.text_color)
-                    if test_surface.get_width() > max_width:
-                        if current_line:
-                            total_height += line_height
-                        current_line = word + " "
-                    else:
-                        current_line = test_line
-                if current_line:
-                    total_height += line_height
-            else:
-                total_height += int(15 * self.scale_y)
-
-        # Calculate max scroll
-        self.email_max_scroll = max(0, total_height - visible_height + int(20 * self.scale_y))
-        self.email_scroll = max(0, min(self.email_scroll, self.email_max_scroll))
-
-        # Create clipping rect
-        clip_rect = pygame.Rect(text_x, body_start_y, max_width + int(10 * self.scale_x), visible_height)
-        self.screen.set_clip(clip_rect)
-
-        # Draw email body with scroll
-        text_y = body_start_y - self.email_scroll
-
-        for line in body_lines:
-            if line.strip():
-                words = line.split(' ')
-                current_line = ""
-
-                for word in words:
-                    test_line = current_line + word + " "
-                    test_surface = self.body_font.render(test_line, True, self.text_color)
-
-                    if test_surface.get_width() > max_width:
-                        if current_line:
-                            if body_start_y - line_height < text_y < body_start_y + visible_height:
-                                line_surface = self.body_font.render(current_line.strip(), True, self.text_color)
-                                self.screen.blit(line_surface, (text_x, text_y))
-                            text_y += line_height
-                        current_line = word + " "
-                    else:
-                        current_line = test_line
-
-                if current_line:
-                    if body_start_y - line_height < text_y < body_start_y + visible_height:
-                        line_surface = self.body_font.render(current_line.strip(), True, self.text_color)
-                        self.screen.blit(line_surface, (text_x, text_y))
-                    text_y += line_height
-            else:
-                text_y += int(15 * self.scale_y)
-
-        self.screen.set_clip(None)
-
-        # Draw scroll bar if needed
-        if self.email_max_scroll > 0:
-            scrollbar_x = content_x + content_width - scrollbar_width - int(10 * self.scale_x)
-            track_rect = pygame.Rect(scrollbar_x, body_start_y, scrollbar_width, visible_height)
-            pygame.draw.rect(self.screen, (40, 45, 55), track_rect, border_radius=int(4 * self.scale))
-
-            thumb_height = max(int(30 * self.scale_y), int(visible_height * (visible_height / total_height)))
-            scroll_ratio = self.email_scroll / self.email_max_scroll if self.email_max_scroll > 0 else 0
-            thumb_y = body_start_y + int(scroll_ratio * (visible_height - thumb_height))
-
-            thumb_rect = pygame.Rect(scrollbar_x, thumb_y, scrollbar_width, thumb_height)
-            mouse_pos = pygame.mouse.get_pos()
-            thumb_color = self.primary_color if thumb_rect.collidepoint(mouse_pos) else (80, 100, 90)
-            pygame.draw.rect(self.screen, thumb_color, thumb_rect, border_radius=int(4 * self.scale))
-
-    def handle_category_click(self, pos: Tuple[int, int]):
-        """Handle click on category"""
-        for cat_id, rect in self.category_rects.items():
-            if rect.collidepoint(pos):
-                self.selected_category = cat_id
-                self.current_page = "threads"
-                return
-
-    def handle_thread_click(self, pos: Tuple[int, int]):
-        """Handle click on thread"""
-        for thread_id, rect in self.thread_rects.items():
-            if rect.collidepoint(pos):
-                # TODO: Open thread view page
-                # For now, just print
-                print(f"Thread {thread_id} clicked")
-                return
-
     def handle_market_click(self, pos: Tuple[int, int]):
         """Handle click on market tool download buttons"""
-        if not hasattr(self, 'market_tool_rects'):
+        if not self.market_tool_rects:
             return
-
-        for tool_id, rect in self.market_tool_rects.items():
-            if rect.collidepoint(pos):
-                # Start download
-                self.start_tool_download(tool_id)
-                return
+        # One C-level scan over all button rects instead of a Python loop
+        idx = pygame.Rect(pos, (1, 1)).collidelist(list(self.market_tool_rects.values()))
+        if idx >= 0:
+            # Start download
+            self.start_tool_download(list(self.market_tool_rects)[idx])
 
     def start_tool_download(self, tool_id: str):
-        """Start downloading a tool with progress bar animation"""
-        import time
-
-        # Tool info for display
-        tool_names = {
-            "wireshark": "Wireshark",
-            "pcap_analyzer": "PCAP Analyzer",
-            "nmap_pro": "Nmap Pro",
-            "metasploit": "Metasploit Framework",
-            "burpsuite": "Burp Suite",
-            "hashcat": "Hashcat"
-        }
+        """Start downloading a tool; progress advances in the run() loop"""
+        tool = _MARKET_TOOLS_BY_ID.get(tool_id)
+        tool_name = tool.name if tool else tool_id
+        tool_price = tool.price if tool else 0
 
-        tool_name = tool_names.get(tool_id, tool_id)
-
-        # Find tool price
-        tool_price = 0
-        # We need to reconstruct the market tools list to find the price or define it here
-        # For simplicity, let's use the known prices
-        if tool_id == "wireshark":
-            tool_price = 300
-        elif tool_id == "pcap_analyzer":
-            tool_price = 400
-        elif tool_id == "nmap_pro":
-            tool_price = 150
-            
         # Deduct credits
         if 'progress' in self.profile_data and 'credits' in self.profile_data['progress']:
             if self.profile_data['progress']['credits'] >= tool_price:
@@ -1150,129 +1321,131 @@ class ForumBrowser:
             else:
                 return # Should not happen due to UI check, but safety first
 
-        # Download progress bar overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
+        self._download = {
+            'tool_id': tool_id,
+            'tool_name': tool_name,
+            'progress': 0.0,
+            'speed': 2.5,  # Progress per frame
+            'complete_at': None,
+        }
 
-        # Progress bar dimensions
-        bar_width = int(500 * self.scale_x)
-        bar_height = int(30 * self.scale_y)
-        bar_x = (self.screen_width - bar_width) // 2
-        bar_y = self.screen_height // 2
+    def _get_save_manager(self) -> SaveLoadManager:
+        """Return the shared SaveLoadManager, building it on first use"""
+        if self._save_mgr is None:
+            self._save_mgr = SaveLoadManager()
+        return self._save_mgr
 
-        # Panel dimensions
-        panel_width = int(600 * self.scale_x)
-        panel_height = int(150 * self.scale_y)
-        panel_x = (self.screen_width - panel_width) // 2
-        panel_y = self.screen_height // 2 - int(50 * self.scale_y)
+    def _update_download(self):
+        """Advance the active download by one frame"""
+        dl = self._download
+        if dl is None:
+            return
 
-        clock = pygame.time.Clock()
+        if dl['complete_at'] is None:
+            # Variable speed for realism
+            dl['progress'] = min(100.0, dl['progress'] + dl['speed'] + random.uniform(-0.5, 1.0))
+            if dl['progress'] >= 100.0:
+                self._finish_download(dl)
+        elif pygame.time.get_ticks() - dl['complete_at'] >= 1500:
+            # Completion message has been shown long enough
+            self._download = None
+
+    def _finish_download(self, dl: Dict):
+        """Add the downloaded tool to the profile and save"""
+        tool_id = dl['tool_id']
+        if 'downloaded_tools' not in self.profile_data:
+            self.profile_data['downloaded_tools'] = []
 
-        # Simulate download progress
-        progress = 0
-        download_speed = 2.5  # Progress per frame
+        if tool_id not in self.profile_data['downloaded_tools']:
+            self.profile_data['downloaded_tools'].append(tool_id)
 
-        while progress < 100:
-            clock.tick(60)
+            # Save profile
+            self._get_save_manager().save_profile(self.profile_data)
 
-            # Handle events (allow quit)
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        return  # Cancel download
+        dl['complete_at'] = pygame.time.get_ticks()
 
-            # Update progress (variable speed for realism)
-            import random
-            progress += download_speed + random.uniform(-0.5, 1.0)
-            if progress > 100:
-                progress = 100
+    def _build_download_static(self, dl: Dict, done: bool) -> pygame.Surface:
+        """Render everything in the download modal that never changes
+        (dim overlay, panel, title, bar track, status) onto one surface"""
+        if self._dim_overlay is None:
+            self._dim_overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+            self._dim_overlay.fill((0, 0, 0, 200))
 
-            # Draw current market page behind overlay
-            self.screen.fill(self.bg_color)
-            self.draw_browser_chrome()
-            self.draw_top_navigation()
-            self.draw_market_page()
+        static = self._dim_overlay.copy()
 
-            # Draw overlay
-            self.screen.blit(overlay, (0, 0))
+        panel_width = int(600 * self.scale_x)
+        panel_height = int(150 * self.scale_y)
+        panel_x = (self.screen_width - panel_width) // 2
+        panel_y = self.screen_height // 2 - int(50 * self.scale_y)
 
-            # Draw panel
-            panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-            pygame.draw.rect(self.screen, (25, 30, 40), panel_rect, border_radius=int(10 * self.scale))
-            pygame.draw.rect(self.screen, (0, 200, 100), panel_rect, width=2, border_radius=int(10 * self.scale))
+        panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
+        pygame.draw.rect(static, (25, 30, 40), panel_rect, border_radius=self._layout[L.S10])
+        pygame.draw.rect(static, (0, 200, 100), panel_rect, width=2, border_radius=self._layout[L.S10])
 
-            # Title
-            title_text = self.heading_font.render(f"Telechargement de {tool_name}...", True, (0, 220, 100))
+        if not done:
+            title_text = self._render_cached(self.heading_font, f"Telechargement de {dl['tool_name']}...", (0, 220, 100))
             title_rect = title_text.get_rect(centerx=self.screen_width // 2, top=panel_y + int(20 * self.scale_y))
-            self.screen.blit(title_text, title_rect)
+            static.blit(title_text, title_rect)
 
-            # Progress bar background
-            bar_bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-            pygame.draw.rect(self.screen, (40, 45, 55), bar_bg_rect, border_radius=int(5 * self.scale))
+            bar_x, bar_y, bar_width, bar_height = self._download_bar_geom()
+            pygame.draw.rect(static, (40, 45, 55),
+                             (bar_x, bar_y, bar_width, bar_height),
+                             border_radius=self._layout[L.S5])
 
-            # Progress bar fill
-            fill_width = int((progress / 100) * bar_width)
-            if fill_width > 0:
-                fill_rect = pygame.Rect(bar_x, bar_y, fill_width, bar_height)
-                pygame.draw.rect(self.screen, (0, 200, 100), fill_rect, border_radius=int(5 * self.scale))
-
-            # Progress percentage
-            percent_text = self.body_font.render(f"{int(progress)}%", True, (255, 255, 255))
-            percent_rect = percent_text.get_rect(center=bar_bg_rect.center)
-            self.screen.blit(percent_text, percent_rect)
-
-            # Status text
-            status_text = self.small_font.render("Connexion securisee... Ne pas fermer le navigateur", True, (150, 150, 160))
+            status_text = self._render_cached(self.small_font, "Connexion securisee... Ne pas fermer le navigateur", (150, 150, 160))
             status_rect = status_text.get_rect(centerx=self.screen_width // 2, top=bar_y + bar_height + int(15 * self.scale_y))
-            self.screen.blit(status_text, status_rect)
-
-            pygame.display.flip()
-
-        # Download complete - add to profile
-        if 'downloaded_tools' not in self.profile_data:
-            self.profile_data['downloaded_tools'] = []
-
-        if tool_id not in self.profile_data['downloaded_tools']:
-            self.profile_data['downloaded_tools'].append(tool_id)
+            static.blit(status_text, status_rect)
+        else:
+            success_text = self._render_cached(self.heading_font, f"{dl['tool_name']} installe avec succes!", (0, 255, 100))
+            success_rect = success_text.get_rect(centerx=self.screen_width // 2, centery=panel_rect.centery - int(10 * self.scale_y))
+            static.blit(success_text, success_rect)
 
-            # Save profile
-            from src.core.save_load import SaveLoadManager
-            save_mgr = SaveLoadManager()
-            save_mgr.save_profile(self.profile_data)
+            hint_text = self._render_cached(self.body_font, "Disponible dans Net Scanner sur le bureau", (150, 150, 160))
+            hint_rect = hint_text.get_rect(centerx=self.screen_width // 2, centery=panel_rect.centery + int(25 * self.scale_y))
+            static.blit(hint_text, hint_rect)
 
-        # Show completion message briefly
-        complete_start = pygame.time.get_ticks()
-        while pygame.time.get_ticks() - complete_start < 1500:
-            clock.tick(60)
+        return static
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return
+    def _download_bar_geom(self) -> Tuple[int, int, int, int]:
+        """Progress bar (x, y, w, h) shared by the static and dynamic draws"""
+        bar_width = int(500 * self.scale_x)
+        bar_height = int(30 * self.scale_y)
+        return ((self.screen_width - bar_width) // 2, self.screen_height // 2,
+                bar_width, bar_height)
 
-            # Draw completion
-            self.screen.fill(self.bg_color)
-            self.draw_browser_chrome()
-            self.draw_top_navigation()
-            self.draw_market_page()
+    def _draw_download_overlay(self):
+        """Draw the download modal: one static blit plus the live fill bar"""
+        dl = self._download
+        done = dl['complete_at'] is not None
 
-            self.screen.blit(overlay, (0, 0))
+        key = 'static_done' if done else 'static'
+        static = dl.get(key)
+        if static is None:
+            static = dl[key] = self._build_download_static(dl, done)
+        self.screen.blit(static, (0, 0))
 
-            # Panel
-            pygame.draw.rect(self.screen, (25, 30, 40), panel_rect, border_radius=int(10 * self.scale))
-            pygame.draw.rect(self.screen, (0, 200, 100), panel_rect, width=2, border_radius=int(10 * self.scale))
+        if not done:
+            bar_x, bar_y, bar_width, bar_height = self._download_bar_geom()
 
-            # Success message
-            success_text = self.heading_font.render(f"{tool_name} installe avec succes!", True, (0, 255, 100))
-            success_rect = success_text.get_rect(centerx=self.screen_width // 2, centery=panel_rect.centery - int(10 * self.scale_y))
-            self.screen.blit(success_text, success_rect)
+            fill_width = int((dl['progress'] / 100) * bar_width)
+            if fill_width > 0:
+                pygame.draw.rect(self.screen, (0, 200, 100),
+                                 (bar_x, bar_y, fill_width, bar_height),
+                                 border_radius=self._layout[L.S5])
 
-            hint_text = self.body_font.render("Disponible dans Net Scanner sur le bureau", True, (150, 150, 160))
-            hint_rect = hint_text.get_rect(centerx=self.screen_width // 2, centery=panel_rect.centery + int(25 * self.scale_y))
-            self.screen.blit(hint_text, hint_rect)
+            percent_text = self._render_cached(self.body_font, f"{int(dl['progress'])}%", (255, 255, 255))
+            percent_rect = percent_text.get_rect(center=(bar_x + bar_width // 2, bar_y + bar_height // 2))
+            self.screen.blit(percent_text, percent_rect)
 
-            pygame.display.flip()
+    def _current_frame_state(self) -> Tuple:
+        """Everything the draw path depends on, for change detection"""
+        return (self.current_page, self.selected_category,
+                self.selected_email_index, self.scroll_offset,
+                self.email_scroll, self.avatar_popup_open,
+                self.editing_bio, self.temp_bio, self.logged_in,
+                self._download is not None,
+                sum(1 for f in self._avatar_futures.values() if not f.done()),
+                self._mouse_pos)
 
     def run(self) -> Tuple[str, str]:
         """
@@ -1281,16 +1454,33 @@ class ForumBrowser:
         Returns:
             Tuple of (result, action)
         """
-        clock = pygame.time.Clock()
+        # The browser polls the mouse directly, so MOUSEMOTION events are
+        # pure queue noise here; block them while this screen runs and
+        # restore them for screens (settings, desktop) that do use them
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
+        try:
+            return self._run_loop()
+        finally:
+            pygame.event.set_allowed(pygame.MOUSEMOTION)
+
+    def _run_loop(self) -> Tuple[str, str]:
+        """Event/draw loop behind run()"""
         running = True
 
         while running:
-            clock.tick(60)
+            self._clock.tick(60)
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     return "exit", None
 
+                # The download modal swallows input; ESC cancels mid-download
+                if self._download is not None:
+                    if (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE
+                            and self._download['complete_at'] is None):
+                        self._download = None
+                    continue
+
                 elif event.type == pygame.KEYDOWN:
                     # Handle text input for bio
                     if self.current_page == "profile" and self.editing_bio:
@@ -1316,17 +1506,12 @@ class ForumBrowser:
                             continue
 
                         # Navigate back
-                        if self.current_page == "threads":
-                            self.current_page = "categories"
-                            self.selected_category = None
-                        elif self.current_page == "market":
-                            self.current_page = "categories"
-                        elif self.current_page == "inbox":
-                            self.current_page = "categories"
-                            self.selected_email_index = None
-                        elif self.current_page == "profile":
-                            self.current_page = "categories"
-                            self.edit_mode = False
+                        back = self._BACK_NAV.get(self.current_page)
+                        if back is not None:
+                            target, reset_attr, reset_value = back
+                            self.current_page = target
+                            if reset_attr is not None:
+                                setattr(self, reset_attr, reset_value)
                         elif self.current_page == "categories":
                             if self.logged_in:
                                 return "back", None
@@ -1348,79 +1533,68 @@ class ForumBrowser:
                             return "back", None
 
                         # Check back button click (browser navigation)
-                        if hasattr(self, 'back_button_rect') and self.back_button_rect.collidepoint(event.pos):
+                        if self.back_button_rect and self.back_button_rect.collidepoint(event.pos):
                             # Navigate back based on current page
-                            if self.current_page == "threads":
-                                self.current_page = "categories"
-                                self.selected_category = None
-                            elif self.current_page == "categories":
-                                if self.logged_in:
-                                    # Stay on categories (main page when logged in)
-                                    pass
-                                else:
-                                    self.current_page = "welcome"
-                            elif self.current_page == "market":
-                                self.current_page = "categories"
-                            elif self.current_page == "thread_view":
-                                self.current_page = "threads"
+                            back = self._BROWSER_BACK.get(self.current_page)
+                            if back is not None:
+                                target, reset_attr, reset_value = back
+                                self.current_page = target
+                                if reset_attr is not None:
+                                    setattr(self, reset_attr, reset_value)
+                            elif self.current_page == "categories" and not self.logged_in:
+                                # Categories is the home page when logged in
+                                self.current_page = "welcome"
                             # Continue to prevent other click handlers from firing
                             continue
 
                         # Check navigation tab clicks (available on all pages)
-                        if hasattr(self, 'nav_tab_rects'):
-                            for tab_id, tab_rect in self.nav_tab_rects.items():
-                                if tab_rect.collidepoint(event.pos):
-                                    # If not logged in, show message requiring account
-                                    if not self.logged_in:
-                                        # User must create account first
-                                        # Force them to welcome page
-                                        if self.current_page != "welcome":
-                                            self.current_page = "welcome"
-                                    else:
-                                        # Logged in, can navigate
-                                        if tab_id == "forum":
-                                            self.current_page = "categories"
-                                            self.selected_category = None
-                                        elif tab_id == "profile":
-                                            # Show profile page within forum
-                                            self.current_page = "profile"
-                                        elif tab_id == "market":
-                                            # Market page
-                                            self.current_page = "market"
-                                        elif tab_id == "email":
-                                            # Open inbox page within forum
-                                            self.current_page = "inbox"
-                                    # Don't process other clicks if tab was clicked
-                                    continue
+                        for tab_id, tab_rect in self.nav_tab_rects.items():
+                            if tab_rect.collidepoint(event.pos):
+                                # If not logged in, show message requiring account
+                                if not self.logged_in:
+                                    # User must create account first
+                                    # Force them to welcome page
+                                    if self.current_page != "welcome":
+                                        self.current_page = "welcome"
+                                else:
+                                    # Logged in, can navigate
+                                    target, clear_category = self._NAV_TAB_TARGETS[tab_id]
+                                    self.current_page = target
+                                    if clear_category:
+                                        self.selected_category = None
+                                    if target == "inbox" and not self._emails_loaded:
+                                        # Load outside the draw path
+                                        self.load_emails_from_inbox()
+                                # Don't process other clicks if tab was clicked
+                                continue
 
                         # Check content back button clicks (page-specific back buttons)
                         if self.current_page == "welcome":
-                            if hasattr(self, 'welcome_back_button') and self.welcome_back_button and self.welcome_back_button.collidepoint(event.pos):
+                            if self.welcome_back_button and self.welcome_back_button.collidepoint(event.pos):
                                 return "back", None
                         elif self.current_page == "categories":
-                            if hasattr(self, 'categories_back_button') and self.categories_back_button and self.categories_back_button.collidepoint(event.pos):
+                            if self.categories_back_button and self.categories_back_button.collidepoint(event.pos):
                                 self.current_page = "welcome"
                                 continue
                         elif self.current_page == "threads":
-                            if hasattr(self, 'threads_back_button') and self.threads_back_button and self.threads_back_button.collidepoint(event.pos):
+                            if self.threads_back_button and self.threads_back_button.collidepoint(event.pos):
                                 self.current_page = "categories"
                                 self.selected_category = None
                                 continue
                         elif self.current_page == "market":
-                            if hasattr(self, 'market_back_button') and self.market_back_button and self.market_back_button.collidepoint(event.pos):
+                            if self.market_back_button and self.market_back_button.collidepoint(event.pos):
                                 self.current_page = "categories"
                                 continue
                         elif self.current_page == "inbox":
-                            if hasattr(self, 'inbox_back_button') and self.inbox_back_button and self.inbox_back_button.collidepoint(event.pos):
+                            if self.inbox_back_button and self.inbox_back_button.collidepoint(event.pos):
                                 self.current_page = "categories"
                                 continue
                         elif self.current_page == "profile":
                             if self.avatar_popup_open:
-                                for rect, avatar_name in self.avatar_option_rects:
-                                    if rect.collidepoint(event.pos):
-                                        self.profile_data['avatar'] = avatar_name
-                                        self.avatar_popup_open = False
-                                        break
+                                avatar_name = self._avatar_grid_hit(event.pos)
+                                if avatar_name is not None:
+                                    self.profile_data['avatar'] = avatar_name
+                                    self.avatar_popup_open = False
                                 continue
 
                             # Bio editing clicks
@@ -1429,8 +1603,7 @@ class ForumBrowser:
                                     self.profile_data['bio'] = self.temp_bio
                                     self.editing_bio = False
                                     # Save profile to disk
-                                    from src.core.save_load import SaveLoadManager
-                                    SaveLoadManager().save_profile(self.profile_data)
+                                    self._get_save_manager().save_profile(self.profile_data)
                                     continue
                                     
                                 if self.cancel_bio_btn_rect and self.cancel_bio_btn_rect.collidepoint(event.pos):
@@ -1442,11 +1615,12 @@ class ForumBrowser:
                                     self.temp_bio = self.profile_data.get('bio', '')
                                     continue
 
-                            if hasattr(self, 'change_avatar_button_rect') and self.change_avatar_button_rect and self.change_avatar_button_rect.collidepoint(event.pos):
+                            if self.change_avatar_button_rect and self.change_avatar_button_rect.collidepoint(event.pos):
                                 self.avatar_popup_open = True
+                                self._warm_avatar_popup()
                                 continue
 
-                            if hasattr(self, 'profile_back_button') and self.profile_back_button and self.profile_back_button.collidepoint(event.pos):
+                            if self.profile_back_button and self.profile_back_button.collidepoint(event.pos):
                                 self.current_page = "categories"
                                 self.edit_mode = False
                                 continue
@@ -1455,9 +1629,10 @@ class ForumBrowser:
                         if self.current_page == "welcome":
                             # Handle login/register buttons
                             if self.login_button_rect and self.login_button_rect.collidepoint(event.pos):
-                                from src.ui.forum_auth import ForumAuth
                                 auth = ForumAuth(self.screen, mode="login")
                                 result, profile_data = auth.run()
+                                # The auth screen painted over us; force a repaint
+                                self._dirty = True
 
                                 if result == "success" and profile_data:
                                     self.logged_in = True
@@ -1471,9 +1646,10 @@ class ForumBrowser:
                                     return "exit", None
 
                             elif self.register_button_rect and self.register_button_rect.collidepoint(event.pos):
-                                from src.ui.forum_auth import ForumAuth
                                 auth = ForumAuth(self.screen, mode="register")
                                 result, profile_data = auth.run()
+                                # The auth screen painted over us; force a repaint
+                                self._dirty = True
 
                                 if result == "success" and profile_data:
                                     self.logged_in = True
@@ -1488,32 +1664,33 @@ class ForumBrowser:
                                 elif result == "exit":
                                     return "exit", None
 
-                        elif self.current_page == "categories":
-                            self.handle_category_click(event.pos)
-                        elif self.current_page == "threads":
-                            self.handle_thread_click(event.pos)
-                        elif self.current_page == "inbox":
-                            self.handle_email_click(event.pos)
-                        elif self.current_page == "market":
-                            self.handle_market_click(event.pos)
+                        else:
+                            if self._current_click_handler is not None:
+                                self._current_click_handler(event.pos)
+
+            # Skip repainting entirely when nothing on screen can have
+            # changed since the last frame (downloads and the blinking bio
+            # cursor animate, so those states always repaint)
+            self._mouse_pos = pygame.mouse.get_pos()
+            frame_state = self._current_frame_state()
+            if (not self._dirty and frame_state == self._frame_state
+                    and self._download is None and not self.editing_bio):
+                continue
+            self._frame_state = frame_state
+            self._dirty = False
 
             # Drawing
             self.screen.fill(self.bg_color)
             self.draw_browser_chrome()
             self.draw_top_navigation()
 
-            if self.current_page == "welcome":
-                self.draw_welcome_page()
-            elif self.current_page == "categories":
-                self.draw_categories_page()
-            elif self.current_page == "threads":
-                self.draw_threads_page()
-            elif self.current_page == "market":
-                self.draw_market_page()
-            elif self.current_page == "inbox":
-                self.draw_inbox_page()
-            elif self.current_page == "profile":
-                self.draw_profile_page()
+            if self._current_draw_handler is not None:
+                self._current_draw_handler()
+
+            if self._download is not None:
+                self._update_download()
+                if self._download is not None:
+                    self._draw_download_overlay()
 
             pygame.display.flip()
 
@@ -1521,49 +1698,66 @@ class ForumBrowser:
 
     def load_emails_from_inbox(self):
         """Load emails from the inbox system"""
-        from src.ui.inbox import Inbox
-        inbox = Inbox(self.screen, self.profile_data)
-        self.emails = inbox.emails
+        if self._inbox is None:
+            self._inbox = Inbox(self.screen, self.profile_data)
+        self.emails = self._inbox.emails
+        self._emails_loaded = True
+        self._dirty = True
+
+        # Wrapped layouts and the reader-panel cache are keyed by
+        # id(email); drop them so entries from freed Email objects can
+        # never alias a recycled id
+        self._wrap_cache.clear()
+        self._email_panel_state = None
+        self._email_panel_surf = None
 
         # Clear notifications when viewing inbox
-        from src.systems.notification_manager import get_notification_manager
-        notification_manager = get_notification_manager()
-        notification_manager.clear_notification()
+        self._notification_manager.clear_notification()
 
     def draw_inbox_page(self):
         """Draw inbox/email page"""
-        content_y = self.browser_bar_height + self.url_bar_height + self.top_bar_height + int(20 * self.scale_y)
-        content_x = int(40 * self.scale_x)
-        content_width = self.screen_width - int(80 * self.scale_x)
+        content_y = self.browser_bar_height + self.url_bar_height + self.top_bar_height + self._layout[L.Y20]
+        content_x = self._layout[L.X40]
+        content_width = self.screen_width - self._layout[L.X80]
 
         # Back button
         self.inbox_back_button = self.draw_back_button(content_x, content_y, "< Forum")
-        header_y = content_y + int(50 * self.scale_y)
+        header_y = content_y + self._layout[L.Y50]
 
         # Header
-        header = self.title_font.render("MESSAGERIE", True, self.primary_color)
+        header = self._lbl_inbox_header
         self.screen.blit(header, (content_x, header_y))
 
-        # Load emails if not already loaded
-        if not self.emails:
+        # Load emails if not already loaded (an empty inbox is a valid
+        # loaded state, so gate on the flag rather than the list)
+        if not self._emails_loaded:
             self.load_emails_from_inbox()
 
         # Email list
-        list_y = header_y + int(60 * self.scale_y)
+        list_y = header_y + self._layout[L.Y60]
         self.email_rects = {}
 
         if not self.emails:
             # No emails message
-            no_email_text = self.body_font.render("Aucun message pour le moment.", True, self.text_dim)
+            no_email_text = self._render_cached(self.body_font, "Aucun message pour le moment.", self.text_dim)
             self.screen.blit(no_email_text, (content_x, list_y))
         else:
-            for i, email in enumerate(self.emails):
-                email_height = int(70 * self.scale_y)
+            row_blits = []
+            mouse_pos = self._mouse_pos
+            email_height = self._layout[L.Y70]
+            row_step = email_height + self._layout[L.Y10]
+
+            # Rows below the bottom edge can't be seen or clicked; cull them
+            # so the loop stays O(visible) for large inboxes
+            visible_rows = min(len(self.emails),
+                               max(0, (self.screen_height - list_y) // row_step + 1))
+
+            for i in range(visible_rows):
+                email = self.emails[i]
                 email_rect = pygame.Rect(content_x, list_y, content_width, email_height)
                 self.email_rects[i] = email_rect
 
                 # Hover/selection effect
-                mouse_pos = pygame.mouse.get_pos()
                 is_hovered = email_rect.collidepoint(mouse_pos)
                 is_selected = (self.selected_email_index == i)
 
@@ -1574,35 +1768,40 @@ class ForumBrowser:
                 else:
                     bg_color = self.post_bg
 
-                pygame.draw.rect(self.screen, bg_color, email_rect, border_radius=int(5 * self.scale))
-                pygame.draw.rect(self.screen, self.border_color, email_rect, width=1, border_radius=int(5 * self.scale))
+                pygame.draw.rect(self.screen, bg_color, email_rect, border_radius=self._layout[L.S5])
+                pygame.draw.rect(self.screen, self.border_color, email_rect, width=1, border_radius=self._layout[L.S5])
 
                 # Unread indicator
                 if not email.read:
-                    unread_x = email_rect.x + int(15 * self.scale_x)
+                    unread_x = email_rect.x + self._layout[L.X15]
                     unread_y = email_rect.centery
-                    pygame.draw.circle(self.screen, self.primary_color, (unread_x, unread_y), int(5 * self.scale))
+                    pygame.draw.circle(self.screen, self.primary_color, (unread_x, unread_y), self._layout[L.S5])
 
                 # Email info
-                text_x = content_x + int(35 * self.scale_x)
+                text_x = content_x + self._layout[L.X35]
 
                 # Sender
-                sender_text = self.body_font.render(f"De: {email.sender}", True, self.text_bright if not email.read else self.text_color)
-                self.screen.blit(sender_text, (text_x, email_rect.y + int(10 * self.scale_y)))
+                sender_text = self._render_cached(self.body_font, f"De: {email.sender}", self.text_bright if not email.read else self.text_color)
+                row_blits.append((sender_text, (text_x, email_rect.y + self._layout[L.Y10])))
 
                 # Subject
-                subject_text = self.body_font.render(email.subject, True, self.text_bright if not email.read else self.text_color)
-                self.screen.blit(subject_text, (text_x, email_rect.y + int(35 * self.scale_y)))
+                subject_text = self._render_cached(self.body_font, email.subject, self.text_bright if not email.read else self.text_color)
+                row_blits.append((subject_text, (text_x, email_rect.y + self._layout[L.Y35])))
+
+                list_y += row_step
+
+            # The reader panel sits below the full list, culled rows included
+            list_y += (len(self.emails) - visible_rows) * row_step
 
-                list_y += email_height + int(10 * self.scale_y)
+            self.screen.blits(row_blits, doreturn=0)
 
             # If an email is selected, show its content
             if self.selected_email_index is not None and 0 <= self.selected_email_index < len(self.emails):
                 self._draw_email_content(content_x, list_y, content_width)
 
         # Instructions
-        instructions_y = self.screen_height - int(35 * self.scale_y)
-        instructions = self.small_font.render("CLIC: Lire l'email | ESC: Retour", True, self.dim_text)
+        instructions_y = self.screen_height - self._layout[L.Y35]
+        instructions = self._lbl_inbox_instructions
         self.screen.blit(instructions, (content_x, instructions_y))
 
     def _draw_email_content(self, content_x: int, start_y: int, content_width: int):
@@ -1613,142 +1812,127 @@ class ForumBrowser:
         email = self.emails[self.selected_email_index]
 
         # Content panel
-        panel_y = start_y + int(10 * self.scale_y)
-        panel_height = self.screen_height - panel_y - int(60 * self.scale_y)
-        scrollbar_width = int(12 * self.scale_x)
-        panel_rect = pygame.Rect(content_x, panel_y, content_width, panel_height)
+        panel_y = start_y + self._layout[L.Y10]
+        panel_height = self.screen_height - panel_y - self._layout[L.Y60]
+        scrollbar_width = self._layout[L.X12]
+
+        # The panel is pixel-identical between scroll/selection changes;
+        # reuse last frame's pixels when the state key still matches. The
+        # thumb rect from the previous draw is valid here because any
+        # change that moves it also changes the key.
+        thumb_hover = (self._email_thumb_rect is not None
+                       and self._email_thumb_rect.collidepoint(self._mouse_pos))
+        panel_state = (id(email), self.email_scroll, content_x, start_y,
+                       content_width, thumb_hover)
+        cacheable = (panel_height > 0
+                     and panel_y + panel_height <= self.screen_height
+                     and content_x + content_width <= self.screen_width)
+        if cacheable and panel_state == self._email_panel_state and self._email_panel_surf is not None:
+            self.screen.blit(self._email_panel_surf, (content_x, panel_y))
+            return
+        panel_rect = (content_x, panel_y, content_width, panel_height)
 
-        pygame.draw.rect(self.screen, self.content_bg, panel_rect, border_radius=int(8 * self.scale))
-        pygame.draw.rect(self.screen, self.border_color, panel_rect, width=2, border_radius=int(8 * self.scale))
+        pygame.draw.rect(self.screen, self.content_bg, panel_rect, border_radius=self._layout[L.S8])
+        pygame.draw.rect(self.screen, self.border_color, panel_rect, width=2, border_radius=self._layout[L.S8])
 
         # Email header (fixed)
-        text_x = content_x + int(20 * self.scale_x)
-        header_y = panel_y + int(20 * self.scale_y)
+        text_x = content_x + self._layout[L.X20]
+        header_y = panel_y + self._layout[L.Y20]
 
-        from_text = self.body_font.render(f"De: {email.sender}", True, self.primary_color)
+        from_text = self._render_cached(self.body_font, f"De: {email.sender}", self.primary_color)
         self.screen.blit(from_text, (text_x, header_y))
-        header_y += from_text.get_height() + int(10 * self.scale_y)
+        header_y += self._body_line_h + self._layout[L.Y10]
 
-        subject_text = self.heading_font.render(email.subject, True, self.text_bright)
+        subject_text = self._render_cached(self.heading_font, email.subject, self.text_bright)
         self.screen.blit(subject_text, (text_x, header_y))
-        header_y += subject_text.get_height() + int(15 * self.scale_y)
+        header_y += self._heading_line_h + self._layout[L.Y15]
 
         # Divider
-        pygame.draw.line(self.screen, self.border_color,
-                        (text_x, header_y),
-                        (content_x + content_width - int(20 * self.scale_x), header_y), 1)
+        self.screen.fill(self.border_color,
+                         (text_x, header_y,
+                          content_width - self._layout[L.X40], 1))
 
         # Scrollable body area
-        body_start_y = header_y + int(15 * self.scale_y)
-        visible_height = panel_y + panel_height - body_start_y - int(20 * self.scale_y)
-        max_width = content_width - int(60 * self.scale_x) - scrollbar_width
-
-        # Calculate total content height
-        body_lines = email.body.split('\n')
-        total_height = 0
-        line_height = self.body_font.get_height() + int(5 * self.scale_y)
-
-        for line in body_lines:
-            if line.strip():
-                words = line.split(' ')
-                current_line = ""
-                for word in words:
-                    test_line = current_line + word + " "
-                    test_surface = self.body_font.render(test_line, True, self.text_color)
-                    if test_surface.get_width() > max_width:
-                        if current_line:
-                            total_height += line_height
-                        current_line = word + " "
-                    else:
-                        current_line = test_line
-                if current_line:
-                    total_height += line_height
-            else:
-                total_height += int(15 * self.scale_y)
+        body_start_y = header_y + self._layout[L.Y15]
+        visible_height = panel_y + panel_height - body_start_y - self._layout[L.Y20]
+        max_width = content_width - self._layout[L.X60] - scrollbar_width
+
+        # Wrapped layout is computed once per (email, width) and cached
+        body_lines, total_height = self._wrap_email_body(email, max_width)
+        line_height = self._body_line_h + self._layout[L.Y5]
 
         # Calculate max scroll
-        self.email_max_scroll = max(0, total_height - visible_height + int(20 * self.scale_y))
+        self.email_max_scroll = max(0, total_height - visible_height + self._layout[L.Y20])
         self.email_scroll = max(0, min(self.email_scroll, self.email_max_scroll))
 
         # Create clipping rect
-        clip_rect = pygame.Rect(text_x, body_start_y, max_width + int(10 * self.scale_x), visible_height)
-        self.screen.set_clip(clip_rect)
-
-        # Draw email body with scroll
-        text_y = body_start_y - self.email_scroll
-
-        for line in body_lines:
-            if line.strip():
-                words = line.split(' ')
-                current_line = ""
-
-                for word in words:
-                    test_line = current_line + word + " "
-                    test_surface = self.body_font.render(test_line, True, self.text_color)
-
-                    if test_surface.get_width() > max_width:
-                        if current_line:
-                            if body_start_y - line_height < text_y < body_start_y + visible_height:
-                                line_surface = self.body_font.render(current_line.strip(), True, self.text_color)
-                                self.screen.blit(line_surface, (text_x, text_y))
-                            text_y += line_height
-                        current_line = word + " "
-                    else:
-                        current_line = test_line
-
-                if current_line:
-                    if body_start_y - line_height < text_y < body_start_y + visible_height:
-                        line_surface = self.body_font.render(current_line.strip(), True, self.text_color)
-                        self.screen.blit(line_surface, (text_x, text_y))
-                    text_y += line_height
-            else:
-                text_y += int(15 * self.scale_y)
+        self.screen.set_clip((text_x, body_start_y,
+                              max_width + self._layout[L.X10], visible_height))
+
+        # Draw email body with scroll: segments carry their own offsets,
+        # so this is just a visibility filter over pre-positioned lines
+        base_y = body_start_y - self.email_scroll
+        top_limit = body_start_y - line_height
+        bottom_limit = body_start_y + visible_height
+        for line, dy in body_lines:
+            text_y = base_y + dy
+            if top_limit < text_y < bottom_limit:
+                line_surface = self._render_cached(self.body_font, line, self.text_color)
+                self.screen.blit(line_surface, (text_x, text_y))
 
         self.screen.set_clip(None)
 
         # Draw scroll bar if needed
         if self.email_max_scroll > 0:
-            scrollbar_x = content_x + content_width - scrollbar_width - int(10 * self.scale_x)
-            track_rect = pygame.Rect(scrollbar_x, body_start_y, scrollbar_width, visible_height)
-            pygame.draw.rect(self.screen, (40, 45, 55), track_rect, border_radius=int(4 * self.scale))
+            scrollbar_x = content_x + content_width - scrollbar_width - self._layout[L.X10]
+            pygame.draw.rect(self.screen, (40, 45, 55),
+                             (scrollbar_x, body_start_y, scrollbar_width, visible_height),
+                             border_radius=self._layout[L.S4])
 
-            thumb_height = max(int(30 * self.scale_y), int(visible_height * (visible_height / total_height)))
+            thumb_height = max(self._layout[L.Y30], int(visible_height * (visible_height / total_height)))
             scroll_ratio = self.email_scroll / self.email_max_scroll if self.email_max_scroll > 0 else 0
             thumb_y = body_start_y + int(scroll_ratio * (visible_height - thumb_height))
 
             thumb_rect = pygame.Rect(scrollbar_x, thumb_y, scrollbar_width, thumb_height)
-            mouse_pos = pygame.mouse.get_pos()
-            thumb_color = self.primary_color if thumb_rect.collidepoint(mouse_pos) else (80, 100, 90)
-            pygame.draw.rect(self.screen, thumb_color, thumb_rect, border_radius=int(4 * self.scale))
+            self._email_thumb_rect = thumb_rect
+            thumb_color = self.primary_color if thumb_rect.collidepoint(self._mouse_pos) else (80, 100, 90)
+            pygame.draw.rect(self.screen, thumb_color, thumb_rect, border_radius=self._layout[L.S4])
+        else:
+            self._email_thumb_rect = None
+
+        if cacheable:
+            self._email_panel_state = panel_state
+            self._email_panel_surf = self.screen.subsurface(
+                (content_x, panel_y, content_width, panel_height)).copy()
 
 
     def draw_profile_page(self):
         """Draw profile page within forum"""
-        content_y = self.browser_bar_height + self.url_bar_height + self.top_bar_height + int(20 * self.scale_y)
-        content_x = int(40 * self.scale_x)
-        content_width = self.screen_width - int(80 * self.scale_x)
+        content_y = self.browser_bar_height + self.url_bar_height + self.top_bar_height + self._layout[L.Y20]
+        content_x = self._layout[L.X40]
+        content_width = self.screen_width - self._layout[L.X80]
 
         # Back button
         self.profile_back_button = self.draw_back_button(content_x, content_y, "< Forum")
-        header_y = content_y + int(50 * self.scale_y)
+        header_y = content_y + self._layout[L.Y50]
 
         # Header
         header_text = f"Profil de {self.profile_data.get('nickname', 'Joueur')}"
-        header = self.title_font.render(header_text, True, self.primary_color)
+        header = self._render_cached(self.title_font, header_text, self.primary_color)
         self.screen.blit(header, (content_x, header_y))
 
         # Simple profile view for now
-        profile_y = header_y + int(60 * self.scale_y)
+        profile_y = header_y + self._layout[L.Y60]
         
         # Avatar Section
         current_avatar = self.profile_data.get('avatar', 'avatar_1.png')
         
         # Draw Avatar Box (Placeholder if image not found)
-        avatar_size = int(120 * self.scale)
+        avatar_size = self._layout[L.S120]
         avatar_rect = pygame.Rect(content_x, profile_y, avatar_size, avatar_size)
         
         # Draw background
-        pygame.draw.rect(self.screen, self.post_bg, avatar_rect, border_radius=int(10 * self.scale))
+        pygame.draw.rect(self.screen, self.post_bg, avatar_rect, border_radius=self._layout[L.S10])
         
         # Try to load avatar image
         avatar_surf = self._get_avatar_image(current_avatar, avatar_size)
@@ -1761,74 +1945,74 @@ class ForumBrowser:
             self.screen.blit(avatar_surf, avatar_rect)
         else:
             # Fallback text
-            avatar_text = self.heading_font.render(current_avatar[:2].upper(), True, self.primary_color)
+            avatar_text = self._render_cached(self.heading_font, current_avatar[:2].upper(), self.primary_color)
             text_rect = avatar_text.get_rect(center=avatar_rect.center)
             self.screen.blit(avatar_text, text_rect)
             
         # Draw border
-        pygame.draw.rect(self.screen, self.border_color, avatar_rect, 2, border_radius=int(10 * self.scale))
+        pygame.draw.rect(self.screen, self.border_color, avatar_rect, 2, border_radius=self._layout[L.S10])
         
         # Change Avatar Button
-        btn_width = int(200 * self.scale_x)
-        btn_height = int(40 * self.scale_y)
-        btn_x = content_x + avatar_size + int(30 * self.scale_x)
-        btn_y = profile_y + int(15 * self.scale_y)
+        btn_width = self._layout[L.X200]
+        btn_height = self._layout[L.Y40]
+        btn_x = content_x + avatar_size + self._layout[L.X30]
+        btn_y = profile_y + self._layout[L.Y15]
         
         self.change_avatar_button_rect = pygame.Rect(btn_x, btn_y, btn_width, btn_height)
         
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self._mouse_pos
         is_hovered = self.change_avatar_button_rect.collidepoint(mouse_pos)
         btn_color = self.button_hover if is_hovered else self.button_bg
         
-        pygame.draw.rect(self.screen, btn_color, self.change_avatar_button_rect, border_radius=int(5 * self.scale))
-        pygame.draw.rect(self.screen, self.border_color, self.change_avatar_button_rect, 1, border_radius=int(5 * self.scale))
+        pygame.draw.rect(self.screen, btn_color, self.change_avatar_button_rect, border_radius=self._layout[L.S5])
+        pygame.draw.rect(self.screen, self.border_color, self.change_avatar_button_rect, 1, border_radius=self._layout[L.S5])
         
-        btn_text = self.body_font.render("CHANGER AVATAR", True, self.text_color)
+        btn_text = self._render_cached(self.body_font, "CHANGER AVATAR", self.text_color)
         btn_text_rect = btn_text.get_rect(center=self.change_avatar_button_rect.center)
         self.screen.blit(btn_text, btn_text_rect)
         
         # XP and Level Stats
         xp = self.profile_data.get('progress', {}).get('xp', 0)
         level = self.profile_data.get('progress', {}).get('level', 'Debutant')
-        stats_text = self.body_font.render(f"Niveau: {level}  |  XP: {xp}", True, self.accent_color)
-        self.screen.blit(stats_text, (btn_x, btn_y + btn_height + int(15 * self.scale_y)))
+        stats_text = self._render_cached(self.body_font, f"Niveau: {level}  |  XP: {xp}", self.accent_color)
+        self.screen.blit(stats_text, (btn_x, btn_y + btn_height + self._layout[L.Y15]))
         
-        profile_y += avatar_size + int(40 * self.scale_y)
+        profile_y += avatar_size + self._layout[L.Y40]
 
         # Bio
-        bio_title = self.heading_font.render("Biographie:", True, self.text_color)
+        bio_title = self._render_cached(self.heading_font, "Biographie:", self.text_color)
         self.screen.blit(bio_title, (content_x, profile_y))
         
         # Edit Bio Button (if not editing)
         if not self.editing_bio:
-            edit_btn_text = self.small_font.render("[MODIFIER]", True, self.accent_color)
-            edit_btn_x = content_x + bio_title.get_width() + int(20 * self.scale_x)
+            edit_btn_text = self._render_cached(self.small_font, "[MODIFIER]", self.accent_color)
+            edit_btn_x = content_x + bio_title.get_width() + self._layout[L.X20]
             edit_btn_y = profile_y + (bio_title.get_height() - edit_btn_text.get_height()) // 2
             self.edit_bio_btn_rect = pygame.Rect(edit_btn_x, edit_btn_y, edit_btn_text.get_width(), edit_btn_text.get_height())
             
             # Hover effect
-            if self.edit_bio_btn_rect.collidepoint(pygame.mouse.get_pos()):
-                edit_btn_text = self.small_font.render("[MODIFIER]", True, self.primary_color)
+            if self.edit_bio_btn_rect.collidepoint(mouse_pos):
+                edit_btn_text = self._render_cached(self.small_font, "[MODIFIER]", self.primary_color)
                 
             self.screen.blit(edit_btn_text, (edit_btn_x, edit_btn_y))
             
-            profile_y += int(40 * self.scale_y)
+            profile_y += self._layout[L.Y40]
             
             bio_text = self.profile_data.get('bio', 'Aucune biographie')
-            bio_surface = self.body_font.render(bio_text, True, self.text_dim)
+            bio_surface = self._render_cached(self.body_font, bio_text, self.text_dim)
             self.screen.blit(bio_surface, (content_x, profile_y))
             
         else:
             # Editing mode
-            profile_y += int(40 * self.scale_y)
+            profile_y += self._layout[L.Y40]
             
             # Input box
-            input_width = int(600 * self.scale_x)
-            input_height = int(50 * self.scale_y)
+            input_width = self._layout[L.X600]
+            input_height = self._layout[L.Y50]
             self.bio_input_rect = pygame.Rect(content_x, profile_y, input_width, input_height)
             
-            pygame.draw.rect(self.screen, self.input_bg, self.bio_input_rect, border_radius=int(5 * self.scale))
-            pygame.draw.rect(self.screen, self.primary_color, self.bio_input_rect, 1, border_radius=int(5 * self.scale))
+            pygame.draw.rect(self.screen, self.input_bg, self.bio_input_rect, border_radius=self._layout[L.S5])
+            pygame.draw.rect(self.screen, self.primary_color, self.bio_input_rect, 1, border_radius=self._layout[L.S5])
             
             # Render text
             bio_surface = self.body_font.render(self.temp_bio, True, self.text_bright)
@@ -1841,21 +2025,21 @@ class ForumBrowser:
                 pygame.draw.line(self.screen, self.primary_color, (cursor_x, cursor_y), (cursor_x, cursor_y + bio_surface.get_height()), 2)
             
             # Save/Cancel buttons
-            btn_y = profile_y + input_height + int(10 * self.scale_y)
+            btn_y = profile_y + input_height + self._layout[L.Y10]
             
             # Save
-            save_text = self.small_font.render("[SAUVEGARDER]", True, self.primary_color)
+            save_text = self._render_cached(self.small_font, "[SAUVEGARDER]", self.primary_color)
             self.save_bio_btn_rect = pygame.Rect(content_x, btn_y, save_text.get_width(), save_text.get_height())
             self.screen.blit(save_text, (content_x, btn_y))
             
             # Cancel
-            cancel_text = self.small_font.render("[ANNULER]", True, self.error_color)
+            cancel_text = self._render_cached(self.small_font, "[ANNULER]", self.error_color)
             self.cancel_bio_btn_rect = pygame.Rect(content_x + save_text.get_width() + 20, btn_y, cancel_text.get_width(), cancel_text.get_height())
             self.screen.blit(cancel_text, (content_x + save_text.get_width() + 20, btn_y))
 
         # Instructions
-        instructions_y = self.screen_height - int(35 * self.scale_y)
-        instructions = self.small_font.render("ESC: Retour au forum", True, self.dim_text)
+        instructions_y = self.screen_height - self._layout[L.Y35]
+        instructions = self._lbl_profile_instructions
         self.screen.blit(instructions, (content_x, instructions_y))
         
         # Draw Popup if open
@@ -1863,40 +2047,50 @@ class ForumBrowser:
             self.draw_avatar_popup()
 
     def draw_avatar_popup(self):
-        # Overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0, 0))
+        # Overlay (shared with the download modal, built on first use)
+        if self._dim_overlay is None:
+            self._dim_overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+            self._dim_overlay.fill((0, 0, 0, 200))
+        self.screen.blit(self._dim_overlay, (0, 0))
         
         # Popup Box
-        popup_width = int(600 * self.scale_x)
-        popup_height = int(400 * self.scale_y)
+        popup_width = self._layout[L.X600]
+        popup_height = self._layout[L.Y400]
         popup_x = (self.screen_width - popup_width) // 2
         popup_y = (self.screen_height - popup_height) // 2
         
         popup_rect = pygame.Rect(popup_x, popup_y, popup_width, popup_height)
-        pygame.draw.rect(self.screen, self.content_bg, popup_rect, border_radius=int(10 * self.scale))
-        pygame.draw.rect(self.screen, self.primary_color, popup_rect, 2, border_radius=int(10 * self.scale))
+        pygame.draw.rect(self.screen, self.content_bg, popup_rect, border_radius=self._layout[L.S10])
+        pygame.draw.rect(self.screen, self.primary_color, popup_rect, 2, border_radius=self._layout[L.S10])
         
         # Title
-        title = self.heading_font.render("CHOISIR UN AVATAR", True, self.text_bright)
-        title_rect = title.get_rect(centerx=popup_rect.centerx, top=popup_y + int(20 * self.scale_y))
-        self.screen.blit(title, title_rect)
+        title = self._lbl_avatar_title
+        title_rect = title.get_rect(centerx=popup_rect.centerx, top=popup_y + self._layout[L.Y20])
+        # Text and avatar surfaces are batched into one blit call at the
+        # end; only the per-slot rect fills stay in the loop
+        blit_list = [(title, title_rect)]
         
         # Avatar Grid
-        grid_y = title_rect.bottom + int(30 * self.scale_y)
-        grid_start_x = popup_x + int(50 * self.scale_x)
+        grid_y = title_rect.bottom + self._layout[L.Y30]
+        grid_start_x = popup_x + self._layout[L.X50]
         
         self.avatar_option_rects = []
         
         # 3x2 grid
         cols = 3
-        spacing_x = int(30 * self.scale_x)
-        spacing_y = int(30 * self.scale_y)
-        item_size = int(100 * self.scale)
-        
-        mouse_pos = pygame.mouse.get_pos()
+        spacing_x = self._layout[L.X30]
+        spacing_y = self._layout[L.Y30]
+        item_size = self._layout[L.S100]
         
+        self._avatar_grid = (grid_start_x, grid_y, item_size,
+                             spacing_x, spacing_y, cols, len(self.avatar_options))
+
+        mouse_pos = self._mouse_pos
+
+        # SDL rejects anything outside the clip before touching pixels, so
+        # partially visible slots can't spill past the popup frame
+        self.screen.set_clip(popup_rect)
+
         for i, avatar_name in enumerate(self.avatar_options):
             row = i // cols
             col = i % cols
@@ -1906,81 +2100,170 @@ class ForumBrowser:
             
             rect = pygame.Rect(x, y, item_size, item_size)
             self.avatar_option_rects.append((rect, avatar_name))
-            
+
+            # Slots past the popup bottom (more avatars than the 3x2 grid
+            # holds) render nothing; the cheap rect test skips the
+            # hover/scale/blit work entirely
+            if not popup_rect.colliderect(rect):
+                continue
+
             is_hovered = rect.collidepoint(mouse_pos)
             is_selected = self.profile_data.get('avatar') == avatar_name
             
             bg_color = self.button_hover if is_hovered else self.post_bg
             border_col = self.primary_color if is_selected else (self.accent_color if is_hovered else self.border_color)
             
-            pygame.draw.rect(self.screen, bg_color, rect, border_radius=int(8 * self.scale))
-            pygame.draw.rect(self.screen, border_col, rect, 2 if is_selected else 1, border_radius=int(8 * self.scale))
+            pygame.draw.rect(self.screen, bg_color, rect, border_radius=self._layout[L.S8])
+            pygame.draw.rect(self.screen, border_col, rect, 2 if is_selected else 1, border_radius=self._layout[L.S8])
             
             # Draw avatar image
             avatar_surf = self._get_avatar_image(avatar_name, item_size)
             if avatar_surf:
-                self.screen.blit(avatar_surf, rect)
+                blit_list.append((avatar_surf, rect.topleft))
             else:
-                # Placeholder text for avatar image
-                text = self.heading_font.render(str(i+1), True, self.text_color)
-                text_rect = text.get_rect(center=rect.center)
-                self.screen.blit(text, text_rect)
+                # Placeholder text for avatar image; centre by integer
+                # arithmetic rather than allocating a Rect per slot
+                text = self._render_cached(self.heading_font, str(i+1), self.text_color)
+                w, h = text.get_size()
+                blit_list.append((text, (rect.centerx - w // 2,
+                                         rect.centery - h // 2)))
             
         # Close instruction
-        close_text = self.small_font.render("Cliquer pour selectionner | ESC pour fermer", True, self.dim_text)
-        close_rect = close_text.get_rect(centerx=popup_rect.centerx, bottom=popup_rect.bottom - int(20 * self.scale_y))
-        self.screen.blit(close_text, close_rect)
+        close_text = self._lbl_avatar_close
+        close_rect = close_text.get_rect(centerx=popup_rect.centerx, bottom=popup_rect.bottom - self._layout[L.Y20])
+        blit_list.append((close_text, close_rect))
+        if _HAS_FBLITS:
+            self.screen.fblits(blit_list)
+        else:
+            self.screen.blits(blit_list, doreturn=0)
+        self.screen.set_clip(None)
 
-    def _get_avatar_image(self, avatar_name: str, size: int) -> Optional[pygame.Surface]:
-        """Get avatar image from cache or load it"""
-        cache_key = (avatar_name, size)
-        if cache_key in self.avatar_cache:
-            return self.avatar_cache[cache_key]
-            
-        # Define search paths
-        paths_to_check = [os.path.join("assets", "avatars", avatar_name)]
-        
-        if getattr(sys, 'frozen', False):
-             data_dir = os.environ.get("CYBERHERO_DATA_DIR", ".")
-             paths_to_check.append(os.path.join(data_dir, "assets", "avatars", avatar_name))
-             
-        for path in paths_to_check:
+    def _avatar_grid_hit(self, pos: Tuple[int, int]) -> Optional[str]:
+        """Arithmetic O(1) hit test over the regular avatar grid"""
+        if self._avatar_grid is None:
+            return None
+        grid_x, grid_y, item_size, spacing_x, spacing_y, cols, count = self._avatar_grid
+        if pos[0] < grid_x or pos[1] < grid_y:
+            return None
+        col, off_x = divmod(pos[0] - grid_x, item_size + spacing_x)
+        row, off_y = divmod(pos[1] - grid_y, item_size + spacing_y)
+        # The remainder rejects clicks in the spacing between cells
+        if col >= cols or off_x >= item_size or off_y >= item_size:
+            return None
+        idx = row * cols + col
+        if idx < count:
+            return self.avatar_options[idx]
+        return None
+
+    def _warm_avatar_popup(self):
+        """Kick off decode + scale for every popup tile at open time
+
+        The per-tile surfaces are cached, so the draw loop only blits;
+        requesting them here starts the worker decodes one frame earlier
+        than the first popup draw would.
+        """
+        tile = self._layout[L.S100]
+        for avatar_name in self.avatar_options:
+            self._get_avatar_image(avatar_name, tile)
+
+    def _decode_avatar(self, avatar_name: str) -> Optional[pygame.Surface]:
+        """Locate and decode an avatar file (runs on a worker thread)"""
+        for directory in _AVATAR_DIRS:
+            path = os.path.join(directory, avatar_name)
             if os.path.exists(path):
                 try:
-                    img = pygame.image.load(path).convert_alpha()
-                    scaled = pygame.transform.smoothscale(img, (size, size))
-                    self.avatar_cache[cache_key] = scaled
-                    return scaled
+                    return pygame.image.load(path)
                 except Exception as e:
-                    print(f"Error loading avatar {path}: {e}")
-                
-        # Cache None so we don't retry every frame if missing
-        self.avatar_cache[cache_key] = None
+                    logger.warning("Error loading avatar %s: %s", path, e)
+
         return None
 
+    def _get_avatar_placeholder(self, size: int) -> pygame.Surface:
+        """Grey placeholder shown while an avatar is decoding in the background"""
+        placeholder = self._avatar_placeholders.get(size)
+        if placeholder is None:
+            placeholder = pygame.Surface((size, size))
+            placeholder.fill((60, 60, 65))
+            self._avatar_placeholders[size] = placeholder
+        return placeholder
+
+    def _get_avatar_image(self, avatar_name: str, size: int) -> Optional[pygame.Surface]:
+        """Get avatar image from cache or start loading it asynchronously"""
+        cache_key = (avatar_name, size)
+        if cache_key in self.avatar_cache:
+            return self.avatar_cache[cache_key]
+
+        src = self._avatar_src_cache.get(avatar_name)
+        if src is None:
+            future = self._avatar_futures.get(avatar_name)
+            if future is None:
+                # First request for this file: decode off the render thread
+                # and show a placeholder until the Surface arrives
+                self._avatar_futures[avatar_name] = self._avatar_loader.submit(
+                    self._decode_avatar, avatar_name)
+                return self._get_avatar_placeholder(size)
+
+            if not future.done():
+                return self._get_avatar_placeholder(size)
+
+            img = future.result()
+            if img is None:
+                # Cache None so we don't retry every frame if missing
+                self.avatar_cache[cache_key] = None
+                return None
+
+            # convert_alpha() must run on the thread that owns the display,
+            # so the surface-format conversion happens here, not in the
+            # worker; done once per file, every size scales from this copy
+            src = img.convert_alpha()
+            self._avatar_src_cache[avatar_name] = src
+            del self._avatar_futures[avatar_name]
+
+        scaled = pygame.transform.smoothscale(src, (size, size))
+        self.avatar_cache[cache_key] = scaled
+        return scaled
+
     def handle_category_click(self, pos: Tuple[int, int]):
         """Handle click on category"""
-        for cat_id, rect in self.category_rects.items():
-            if rect.collidepoint(pos):
-                self.selected_category = cat_id
-                self.current_page = "threads"
-                return
+        if self._category_hit is None:
+            return
+        list_x, list_w, list_y, box_height, row_step, cat_ids = self._category_hit
+        x, y = pos
+        if not (list_x <= x <= list_x + list_w) or y < list_y:
+            return
+        # Rows are evenly stacked: one division finds the candidate row,
+        # the remainder rejects clicks in the gap between boxes
+        idx, offset = divmod(y - list_y, row_step)
+        if idx < len(cat_ids) and offset < box_height:
+            self.selected_category = cat_ids[idx]
+            self.current_page = "threads"
 
     def handle_thread_click(self, pos: Tuple[int, int]):
         """Handle click on thread"""
-        for thread_id, rect in self.thread_rects.items():
-            if rect.collidepoint(pos):
-                # TODO: Open thread view page
-                print(f"Thread {thread_id} clicked")
-                return
+        if self._thread_hit is None:
+            return
+        list_x, list_w, list_top, row_height, first, last, thread_ids = self._thread_hit
+        x, y = pos
+        if not (list_x <= x <= list_x + list_w) or y < list_top:
+            return
+        # Contiguous rows: the scroll-adjusted y maps straight to an index
+        idx = (y - list_top + self.scroll_offset) // row_height
+        if first <= idx < last:
+            # TODO: Open thread view page
+            logger.debug("Thread %s clicked", thread_ids[idx])
 
     def handle_email_click(self, pos: Tuple[int, int]):
         """Handle click on email"""
-        for email_idx, rect in self.email_rects.items():
-            if rect.collidepoint(pos):
-                self.selected_email_index = email_idx
-                self.email_scroll = 0  # Reset scroll when selecting new email
-                # Mark email as read
-                if email_idx < len(self.emails):
-                    self.emails[email_idx].read = True
-                return
+        if not self.email_rects:
+            return
+        hit = pygame.Rect(pos, (1, 1)).collidelist(list(self.email_rects.values()))
+        if hit >= 0:
+            email_idx = list(self.email_rects)[hit]
+            self.selected_email_index = email_idx
+            self.email_scroll = 0  # Reset scroll when selecting new email
+            # Mark email as read
+            if email_idx < len(self.emails):
+                self.emails[email_idx].read = True
+                # Wrap the body now, at state-change time, so the frame
+                # that opens the reader pane finds the layout cached
+                self._wrap_email_body(self.emails[email_idx], self._email_body_width())
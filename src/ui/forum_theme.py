@@ -3,12 +3,17 @@ Forum Theme - Unified color scheme for all forum/browser pages
 Ensures consistent dark theme across Navigator, Forum, Profile, Auth
 """
 
+from types import MappingProxyType
+
 # UNIFIED FORUM/BROWSER COLOR SCHEME
 # All forum-related pages should use these colors
 
 class ForumTheme:
     """Centralized color constants for forum browser pages"""
 
+    # Pure namespace: never instantiated with state, so no instance dict
+    __slots__ = ()
+
     # Background colors
     BG_COLOR = (12, 12, 12)           # Almost black - main background
     BROWSER_BAR = (25, 25, 25)        # Dark gray - browser chrome
@@ -40,6 +45,34 @@ class ForumTheme:
     PINNED_COLOR = (200, 50, 50)      # Red - pinned threads
     MOD_COLOR = (220, 180, 0)         # Gold - moderator badges
 
+    # Attribute name -> color applied by apply_to in one dict merge;
+    # panel_bg and dim_text are aliases kept for older call sites
+    _THEME_DICT = {
+        'bg_color': BG_COLOR,
+        'browser_bar': BROWSER_BAR,
+        'content_bg': CONTENT_BG,
+        'post_bg': POST_BG,
+        'panel_bg': CONTENT_BG,
+        'input_bg': INPUT_BG,
+        'input_active_bg': INPUT_ACTIVE,
+        'button_bg': BUTTON_BG,
+        'button_hover': BUTTON_HOVER,
+        'hover_bg': HOVER_BG,
+        'border_color': BORDER_COLOR,
+        'text_color': TEXT_COLOR,
+        'text_dim': TEXT_DIM,
+        'dim_text': TEXT_DIM,
+        'text_bright': TEXT_BRIGHT,
+        'primary_color': PRIMARY_COLOR,
+        'accent_color': ACCENT_COLOR,
+        'link_color': LINK_COLOR,
+        'error_color': ERROR_COLOR,
+        'warning_color': WARNING_COLOR,
+        'success_color': SUCCESS_COLOR,
+        'pinned_color': PINNED_COLOR,
+        'mod_color': MOD_COLOR,
+    }
+
     @classmethod
     def apply_to(cls, obj):
         """
@@ -48,63 +81,27 @@ class ForumTheme:
         Usage:
             ForumTheme.apply_to(self)
         """
-        # Background colors
-        obj.bg_color = cls.BG_COLOR
-        obj.browser_bar = cls.BROWSER_BAR
-        obj.content_bg = cls.CONTENT_BG
-        obj.post_bg = cls.POST_BG
-        obj.panel_bg = cls.CONTENT_BG  # Alias
-        obj.input_bg = cls.INPUT_BG
-        obj.input_active_bg = cls.INPUT_ACTIVE
-        obj.button_bg = cls.BUTTON_BG
-        obj.button_hover = cls.BUTTON_HOVER
-        obj.hover_bg = cls.HOVER_BG
-
-        # Borders
-        obj.border_color = cls.BORDER_COLOR
-
-        # Text
-        obj.text_color = cls.TEXT_COLOR
-        obj.text_dim = cls.TEXT_DIM
-        obj.dim_text = cls.TEXT_DIM  # Alias
-        obj.text_bright = cls.TEXT_BRIGHT
-
-        # Accents
-        obj.primary_color = cls.PRIMARY_COLOR
-        obj.accent_color = cls.ACCENT_COLOR
-        obj.link_color = cls.LINK_COLOR
-        obj.error_color = cls.ERROR_COLOR
-        obj.warning_color = cls.WARNING_COLOR
-        obj.success_color = cls.SUCCESS_COLOR
-
-        # Special
-        obj.pinned_color = cls.PINNED_COLOR
-        obj.mod_color = cls.MOD_COLOR
+        try:
+            # One C-level dict merge instead of one STORE_ATTR per color
+            obj.__dict__.update(cls._THEME_DICT)
+        except AttributeError:
+            # Classes with __slots__ have no instance dict
+            for name, color in cls._THEME_DICT.items():
+                setattr(obj, name, color)
+
+
+# Color dictionary built once at import and shared by every
+# get_forum_colors call; derived from _THEME_DICT minus the apply_to-only
+# aliases, with input_active kept under its historical key
+_FORUM_COLORS = {
+    'input_active' if name == 'input_active_bg' else name: color
+    for name, color in ForumTheme._THEME_DICT.items()
+    if name not in ('panel_bg', 'dim_text')
+}
+_FORUM_COLORS_VIEW = MappingProxyType(_FORUM_COLORS)
 
 
 # Convenience function
 def get_forum_colors():
-    """Get forum color scheme as a dictionary"""
-    return {
-        'bg_color': ForumTheme.BG_COLOR,
-        'browser_bar': ForumTheme.BROWSER_BAR,
-        'content_bg': ForumTheme.CONTENT_BG,
-        'post_bg': ForumTheme.POST_BG,
-        'input_bg': ForumTheme.INPUT_BG,
-        'input_active': ForumTheme.INPUT_ACTIVE,
-        'button_bg': ForumTheme.BUTTON_BG,
-        'button_hover': ForumTheme.BUTTON_HOVER,
-        'hover_bg': ForumTheme.HOVER_BG,
-        'border_color': ForumTheme.BORDER_COLOR,
-        'text_color': ForumTheme.TEXT_COLOR,
-        'text_dim': ForumTheme.TEXT_DIM,
-        'text_bright': ForumTheme.TEXT_BRIGHT,
-        'primary_color': ForumTheme.PRIMARY_COLOR,
-        'accent_color': ForumTheme.ACCENT_COLOR,
-        'link_color': ForumTheme.LINK_COLOR,
-        'error_color': ForumTheme.ERROR_COLOR,
-        'warning_color': ForumTheme.WARNING_COLOR,
-        'success_color': ForumTheme.SUCCESS_COLOR,
-        'pinned_color': ForumTheme.PINNED_COLOR,
-        'mod_color': ForumTheme.MOD_COLOR,
-    }
+    """Get forum color scheme as a read-only dictionary view"""
+    return _FORUM_COLORS_VIEW
@@ -3,9 +3,36 @@ Inbox System - Cyber Hero Terminal Zero
 Mission delivery via mentor emails
 """
 
+import logging
+
 import pygame
 from typing import Tuple, Optional, Dict, List
 
+from src.core.network_simulation import get_network_simulator
+from src.data.professor_emails import (get_welcome_email,
+                                       get_mission1_success_email,
+                                       get_mission2_email)
+from src.systems.notification_manager import get_notification_manager
+
+logger = logging.getLogger(__name__)
+
+# fblits (pygame-ce) skips per-item argument parsing; older builds fall
+# back to blits
+_HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
+# Font objects shared across Inbox instances (and anything else using the
+# same path/size); FreeType opens each face exactly once per process
+_FONT_CACHE = {}
+
+
+def _get_font(path, size) -> pygame.font.Font:
+    key = (path, size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = pygame.font.Font(path, size)
+        _FONT_CACHE[key] = font
+    return font
+
 
 class Email:
     """Represents a mission email"""
@@ -18,6 +45,12 @@ class Email:
         self.mission_id = mission_id
         self.attachments = attachments or []
         self.read = read
+        # Derived presentation fields computed once; subjects and bodies
+        # are immutable so the draw path never re-slices or re-splits them
+        self.display_subject = subject if len(subject) <= 40 else subject[:40] + "..."
+        self.lines = body.split('\n')
+        self.line_count = len(self.lines)
+        self.line_nonblank = [bool(line.strip()) for line in self.lines]
 
 
 class Inbox:
@@ -57,29 +90,140 @@ class Inbox:
 
         # Fonts - Standardized sizes (matching desktop)
         try:
-            self.title_font = pygame.font.Font("assets/fonts/Cyberpunk.ttf", int(42 * self.scale))
-            self.heading_font = pygame.font.Font("assets/fonts/Cyberpunk.ttf", int(32 * self.scale))
-            self.body_font = pygame.font.Font("assets/fonts/Cyberpunk.ttf", int(26 * self.scale))
-            self.small_font = pygame.font.Font("assets/fonts/Cyberpunk.ttf", int(22 * self.scale))
+            self.title_font = _get_font("assets/fonts/Cyberpunk.ttf", int(42 * self.scale))
+            self.heading_font = _get_font("assets/fonts/Cyberpunk.ttf", int(32 * self.scale))
+            self.body_font = _get_font("assets/fonts/Cyberpunk.ttf", int(26 * self.scale))
+            self.small_font = _get_font("assets/fonts/Cyberpunk.ttf", int(22 * self.scale))
         except:
-            self.title_font = pygame.font.Font(None, int(42 * self.scale))
-            self.heading_font = pygame.font.Font(None, int(32 * self.scale))
-            self.body_font = pygame.font.Font(None, int(26 * self.scale))
-            self.small_font = pygame.font.Font(None, int(22 * self.scale))
+            self.title_font = _get_font(None, int(42 * self.scale))
+            self.heading_font = _get_font(None, int(32 * self.scale))
+            self.body_font = _get_font(None, int(26 * self.scale))
+            self.small_font = _get_font(None, int(22 * self.scale))
+
+        # Rendered-text cache shared by draw_sidebar/draw_content; the
+        # strings are static per email so each is rasterized exactly once
+        self._text_cache = {}
+
+        # Sidebar baked to one surface; rebuilt only when selection, hover
+        # or read flags change, blitted as-is otherwise
+        self._sidebar_surf = None
+        self._sidebar_state = None
+        self._sidebar_rects = []
+
+        # Selected email's body + attachments pre-composed into one tall
+        # surface; scrolling moves the source area of a single blit
+        self._body_surf = None
+        self._body_key = None
+
+        # Rounded rectangles (scrollbar track and thumb) pre-rasterized per
+        # size/color variant; border_radius arcs are drawn once, then blitted
+        self._round_rect_cache = {}
+
+        # Redraw gate: run() skips the repaint when no event arrived and
+        # the state snapshot is unchanged
+        self._dirty = True
+
+        # Event dispatch tables used by run() instead of if/elif ladders;
+        # handlers return a (result, mission_id) tuple to leave the loop
+        self._event_handlers = {
+            pygame.QUIT: self._on_quit,
+            pygame.KEYDOWN: self._on_key,
+            pygame.MOUSEWHEEL: self._on_wheel,
+            pygame.MOUSEBUTTONDOWN: self._on_click,
+        }
+        self._key_handlers = {
+            pygame.K_ESCAPE: self._on_escape,
+            pygame.K_RETURN: self._on_return,
+            pygame.K_UP: self._on_up,
+            pygame.K_DOWN: self._on_down,
+        }
 
         # Load emails based on progress
         self.emails = self.load_emails()
+        self._warm_text_cache()
+        # Parallel per-row surface tuples (sender, subject, attachments);
+        # the sidebar bake walks these instead of re-reading Email fields
+        self._row_text = ()
+        self._rebuild_rows()
         self.selected_email_index = 0 if self.emails else None
+        # Maintained incrementally as emails are read or arrive
+        self.unread_count = sum(1 for email in self.emails if not email.read)
 
         # Scroll position for email content
         self.content_scroll = 0
         self.max_scroll = 0  # Will be calculated based on content
         self.scroll_speed = int(30 * self.scale_y)
 
+        # Layout constants derived once from the screen size; the draw
+        # methods only add and compare these plain ints
+        sx, sy = self.scale_x, self.scale_y
+        self.pad10x = int(10 * sx)
+        self.pad20x = int(20 * sx)
+        self.pad25x = int(25 * sx)
+        self.pad10y = int(10 * sy)
+        self.pad15y = int(15 * sy)
+        self.pad20y = int(20 * sy)
+        self.pad30y = int(30 * sy)
+        self.pad35y = int(35 * sy)
+        self.pad40y = int(40 * sy)
+        self.pad45y = int(45 * sy)
+        self.pad50y = int(50 * sy)
+        self.pad60y = int(60 * sy)
+        self.pad70y = int(70 * sy)
+        self.pad80y = int(80 * sy)
+        self.pad100y = int(100 * sy)
+        self.radius4 = int(4 * self.scale)
+        self.radius5 = int(5 * self.scale)
+        self.radius8 = int(8 * self.scale)
+        self.marker_size = int(8 * self.scale)
+        self.sidebar_width = int(400 * sx)
+        self.header_height = int(60 * sy)
+        self.item_height = int(100 * sy)
+        self.line_height = int(28 * sy)
+        self.content_x = int(410 * sx)
+        self.scrollbar_width = int(12 * sx)
+        self.content_width = (self.screen_width - self.content_x
+                              - int(30 * sx) - self.scrollbar_width)
+        self.reply_button_width = int(200 * sx)
+
         # Get notification manager reference
-        from src.systems.notification_manager import get_notification_manager
         self.notification_manager = get_notification_manager()
 
+    def _render(self, font, text, color) -> pygame.Surface:
+        """Render text through the cache; repeated strings blit for free"""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            self._text_cache[key] = surf
+        return surf
+
+    def _warm_text_cache(self):
+        """Pre-render every email's static strings so the first frame is cheap"""
+        for email in self.emails:
+            self._render(self.heading_font, email.sender, self.text_color)
+            self._render(self.body_font, email.display_subject, self.text_color)
+            if email.attachments:
+                self._render(self.small_font, f"[+] {len(email.attachments)} fichier(s)",
+                             self.text_dim)
+            self._render(self.title_font, email.subject, self.text_color)
+            self._render(self.body_font, f"De: {email.sender}", self.text_dim)
+            for line, nonblank in zip(email.lines, email.line_nonblank):
+                if nonblank:
+                    self._render(self.body_font, line, self.text_color)
+            for attachment in email.attachments:
+                self._render(self.body_font, f"[+] {attachment}", self.text_color)
+
+    def _rebuild_rows(self):
+        """Refresh the per-row surface tuples after the email list changes"""
+        self._row_text = tuple(
+            (self._render(self.heading_font, email.sender, self.text_color),
+             self._render(self.body_font, email.display_subject, self.text_color),
+             self._render(self.small_font,
+                          f"[+] {len(email.attachments)} fichier(s)",
+                          self.text_dim) if email.attachments else None)
+            for email in self.emails)
+
     def load_emails(self) -> List[Email]:
         """
         Load available emails based on mission progress
@@ -162,11 +306,11 @@ C'est le moment de prouver ta valeur. Bonne chance.
         progress = self.profile_data.get('progress', {})
         completed = progress.get('missions_completed', [])
         available_emails = []
+        seen_ids = set()
 
         # Add Le Professeur's welcome email if player has forum account
         player_name = self.profile_data.get('nickname', 'Recrue')
         if player_name != 'Nouveau Joueur':  # Player has registered on forum
-            from src.data.professor_emails import get_welcome_email
             welcome_data = get_welcome_email(player_name)
 
             # Convert to Email object
@@ -180,16 +324,17 @@ C'est le moment de prouver ta valeur. Bonne chance.
                 read=welcome_data["read"]
             )
             available_emails.append(welcome_email)
+            seen_ids.add(welcome_email.id)
 
         # Add Mission 1 success email if Mission 1 is complete
-        print(f"[DEBUG INBOX] Checking mission1_completed: completed={completed}, mission1_completed={progress.get('mission1_completed', False)}")
+        logger.debug("Checking mission1_completed: completed=%s, mission1_completed=%s",
+                     completed, progress.get('mission1_completed', False))
         if 'mission1' in completed or progress.get('mission1_completed', False):
-            from src.data.professor_emails import get_mission1_success_email
             success_data = get_mission1_success_email(player_name)
 
             # Check if we haven't already shown this email
             # (to avoid duplicates if it was added during mission completion)
-            if not any(email.id == success_data["id"] for email in available_emails):
+            if success_data["id"] not in seen_ids:
                 success_email = Email(
                     id=success_data["id"],
                     sender=success_data["sender"],
@@ -200,14 +345,14 @@ C'est le moment de prouver ta valeur. Bonne chance.
                     read=success_data["read"]
                 )
                 available_emails.append(success_email)
+                seen_ids.add(success_email.id)
 
         # Add Mission 2 email if Mission 1 is complete
         if 'mission1' in completed or progress.get('mission1_completed', False):
-            from src.data.professor_emails import get_mission2_email
             mission2_data = get_mission2_email(player_name)
 
             # Check if we haven't already shown this email
-            if not any(email.id == mission2_data["id"] for email in available_emails):
+            if mission2_data["id"] not in seen_ids:
                 mission2_email = Email(
                     id=mission2_data["id"],
                     sender=mission2_data["sender"],
@@ -218,6 +363,7 @@ C'est le moment de prouver ta valeur. Bonne chance.
                     read=mission2_data["read"]
                 )
                 available_emails.append(mission2_email)
+                seen_ids.add(mission2_email.id)
 
         # OLD: Show Mission 2 if Mission 1 is complete (from old all_emails array)
         # if 'mission1' in completed:
@@ -229,6 +375,19 @@ C'est le moment de prouver ta valeur. Bonne chance.
 
         return available_emails
 
+    def _sidebar_hover_index(self, mouse_pos: Tuple[int, int]) -> Optional[int]:
+        """Arithmetic hit test over the uniform sidebar rows"""
+        x, y = mouse_pos
+        if not (self.pad10x <= x <= self.sidebar_width - self.pad10x):
+            return None
+        top = self.header_height + self.pad10y
+        if y < top:
+            return None
+        idx, offset = divmod(y - top, self.item_height + self.pad10y)
+        if idx < len(self.emails) and offset < self.item_height:
+            return idx
+        return None
+
     def draw_sidebar(self, mouse_pos: Tuple[int, int]) -> List[pygame.Rect]:
         """
         Draw email list sidebar
@@ -239,76 +398,127 @@ C'est le moment de prouver ta valeur. Bonne chance.
         Returns:
             List of email item rects for click detection
         """
-        sidebar_width = int(400 * self.scale_x)
-
-        # Sidebar background
-        sidebar_rect = pygame.Rect(0, 0, sidebar_width, self.screen_height)
-        pygame.draw.rect(self.screen, self.sidebar_bg, sidebar_rect)
+        hovered = self._sidebar_hover_index(mouse_pos)
+        state = (self.selected_email_index, hovered,
+                 tuple(email.read for email in self.emails))
+        if state != self._sidebar_state:
+            self._build_sidebar(hovered)
+            self._sidebar_state = state
+        self.screen.blit(self._sidebar_surf, (0, 0))
+        return self._sidebar_rects
+
+    def _build_sidebar(self, hovered: Optional[int]):
+        """Bake the whole sidebar into one surface for per-frame blitting"""
+        sidebar_width = self.sidebar_width
+        surf = pygame.Surface((sidebar_width, self.screen_height))
+        surf.fill(self.sidebar_bg)
 
         # Header
-        header_height = int(60 * self.scale_y)
-        pygame.draw.rect(self.screen, self.bg_color, (0, 0, sidebar_width, header_height))
+        header_height = self.header_height
+        pygame.draw.rect(surf, self.bg_color, (0, 0, sidebar_width, header_height))
 
-        inbox_title = self.title_font.render("INBOX", True, self.unread_marker)
-        self.screen.blit(inbox_title, (int(20 * self.scale_x), int(15 * self.scale_y)))
+        # Text surfaces are batched into one blit call at the end; only
+        # the fills and markers draw inside the loop
+        inbox_title = self._render(self.title_font, "INBOX", self.unread_marker)
+        blit_list = [(inbox_title, (self.pad20x, self.pad15y))]
 
         # Email count
-        unread_count = sum(1 for email in self.emails if not email.read)
-        count_text = self.small_font.render(f"{len(self.emails)} messages | {unread_count} non lus",
-                                           True, self.text_dim)
-        self.screen.blit(count_text, (int(20 * self.scale_x), int(45 * self.scale_y)))
+        count_text = self._render(self.small_font,
+                                  f"{len(self.emails)} messages | {self.unread_count} non lus",
+                                  self.text_dim)
+        blit_list.append((count_text, (self.pad20x, self.pad45y)))
 
         # Email items
         email_rects = []
-        item_height = int(100 * self.scale_y)
-        y_offset = header_height + int(10 * self.scale_y)
+        item_height = self.item_height
+        y_offset = header_height + self.pad10y
 
-        for i, email in enumerate(self.emails):
-            item_rect = pygame.Rect(int(10 * self.scale_x), y_offset,
-                                   sidebar_width - int(20 * self.scale_x), item_height)
+        rows = zip(self.emails, self._row_text)
+        for i, (email, (sender_text, subject_text, attach_text)) in enumerate(rows):
+            item_rect = pygame.Rect(self.pad10x, y_offset,
+                                   sidebar_width - self.pad20x, item_height)
 
             # Background color (hover/selected)
-            is_hovered = item_rect.collidepoint(mouse_pos)
             is_selected = (i == self.selected_email_index)
 
             if is_selected:
                 bg_color = self.email_selected
-            elif is_hovered:
+            elif i == hovered:
                 bg_color = self.email_item_hover
             else:
                 bg_color = self.email_item_bg
 
-            pygame.draw.rect(self.screen, bg_color, item_rect, border_radius=int(5 * self.scale))
+            pygame.draw.rect(surf, bg_color, item_rect, border_radius=self.radius5)
 
             # Unread marker
             if not email.read:
-                marker_rect = pygame.Rect(item_rect.x + int(10 * self.scale_x),
-                                         item_rect.y + int(10 * self.scale_y),
-                                         int(8 * self.scale), int(8 * self.scale))
-                pygame.draw.circle(self.screen, self.unread_marker, marker_rect.center, int(4 * self.scale))
+                marker_rect = pygame.Rect(item_rect.x + self.pad10x,
+                                         item_rect.y + self.pad10y,
+                                         self.marker_size, self.marker_size)
+                pygame.draw.circle(surf, self.unread_marker, marker_rect.center, self.radius4)
 
             # Sender
-            sender_text = self.heading_font.render(email.sender, True, self.text_color)
-            self.screen.blit(sender_text, (item_rect.x + int(25 * self.scale_x),
-                                          item_rect.y + int(10 * self.scale_y)))
+            blit_list.append((sender_text, (item_rect.x + self.pad25x,
+                                            item_rect.y + self.pad10y)))
 
             # Subject
-            subject_text = self.body_font.render(email.subject[:40] + ("..." if len(email.subject) > 40 else ""),
-                                                 True, self.text_color)
-            self.screen.blit(subject_text, (item_rect.x + int(25 * self.scale_x),
-                                           item_rect.y + int(40 * self.scale_y)))
+            blit_list.append((subject_text, (item_rect.x + self.pad25x,
+                                             item_rect.y + self.pad40y)))
 
             # Attachments indicator
-            if email.attachments:
-                attach_text = self.small_font.render(f"[+] {len(email.attachments)} fichier(s)",
-                                                     True, self.text_dim)
-                self.screen.blit(attach_text, (item_rect.x + int(25 * self.scale_x),
-                                              item_rect.y + int(70 * self.scale_y)))
+            if attach_text is not None:
+                blit_list.append((attach_text, (item_rect.x + self.pad25x,
+                                                item_rect.y + self.pad70y)))
 
             email_rects.append(item_rect)
-            y_offset += item_height + int(10 * self.scale_y)
+            y_offset += item_height + self.pad10y
+
+        if _HAS_FBLITS:
+            surf.fblits(blit_list)
+        else:
+            surf.blits(blit_list, doreturn=0)
+
+        self._sidebar_surf = surf
+        self._sidebar_rects = email_rects
+
+    def _round_rect(self, size: Tuple[int, int], color, radius: int) -> pygame.Surface:
+        """Cached rounded-rect surface; arc rasterization runs once per variant"""
+        key = (size, color, radius)
+        surf = self._round_rect_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(surf, color, surf.get_rect(), border_radius=radius)
+            self._round_rect_cache[key] = surf
+        return surf
+
+    def _get_body_surface(self, email: Email, width: int) -> pygame.Surface:
+        """Compose the full body and attachment list once per email"""
+        key = (id(email), width)
+        if self._body_key == key:
+            return self._body_surf
+
+        line_height = self.line_height
+        height = email.line_count * line_height
+        if email.attachments:
+            height += self.pad30y + self.pad35y + len(email.attachments) * self.pad30y
+        surf = pygame.Surface((width, max(height, 1)), pygame.SRCALPHA)
+
+        for i, line in enumerate(email.lines):
+            if email.line_nonblank[i]:
+                surf.blit(self._render(self.body_font, line, self.text_color),
+                          (0, i * line_height))
+
+        if email.attachments:
+            attach_y = email.line_count * line_height + self.pad30y
+            surf.blit(self._render(self.heading_font, "FICHIERS JOINTS:", self.unread_marker),
+                      (0, attach_y))
+            for i, attachment in enumerate(email.attachments):
+                surf.blit(self._render(self.body_font, f"[+] {attachment}", self.text_color),
+                          (0, attach_y + self.pad35y + i * self.pad30y))
 
-        return email_rects
+        self._body_key = key
+        self._body_surf = surf
+        return surf
 
     def draw_content(self, mouse_pos):
         """Draw selected email content with scroll bar"""
@@ -318,94 +528,76 @@ C'est le moment de prouver ta valeur. Bonne chance.
         email = self.emails[self.selected_email_index]
 
         # Content area starts after sidebar
-        content_x = int(410 * self.scale_x)
-        scrollbar_width = int(12 * self.scale_x)
-        content_width = self.screen_width - content_x - int(30 * self.scale_x) - scrollbar_width
+        content_x = self.content_x
+        scrollbar_width = self.scrollbar_width
+        content_width = self.content_width
 
         # Header (fixed, not scrollable)
-        header_y = int(20 * self.scale_y)
+        header_y = self.pad20y
 
-        subject_text = self.title_font.render(email.subject, True, self.text_color)
+        subject_text = self._render(self.title_font, email.subject, self.text_color)
         self.screen.blit(subject_text, (content_x, header_y))
 
-        from_text = self.body_font.render(f"De: {email.sender}", True, self.text_dim)
-        self.screen.blit(from_text, (content_x, header_y + int(45 * self.scale_y)))
+        from_text = self._render(self.body_font, f"De: {email.sender}", self.text_dim)
+        self.screen.blit(from_text, (content_x, header_y + self.pad45y))
 
         # Divider
-        divider_y = header_y + int(80 * self.scale_y)
+        divider_y = header_y + self.pad80y
         pygame.draw.line(self.screen, self.border_color,
                         (content_x, divider_y),
-                        (content_x + content_width + scrollbar_width + int(10 * self.scale_x), divider_y), 2)
+                        (content_x + content_width + scrollbar_width + self.pad10x, divider_y), 2)
 
         # Scrollable content area
-        body_start_y = divider_y + int(20 * self.scale_y)
-        visible_height = self.screen_height - body_start_y - int(60 * self.scale_y)
-        line_height = int(28 * self.scale_y)
+        body_start_y = divider_y + self.pad20y
+        visible_height = self.screen_height - body_start_y - self.pad60y
+        line_height = self.line_height
 
         # Calculate total content height
-        lines = email.body.split('\n')
-        total_content_height = len(lines) * line_height
+        total_content_height = email.line_count * line_height
 
         # Add height for attachments
         if email.attachments:
-            total_content_height += int(70 * self.scale_y) + (len(email.attachments) * int(30 * self.scale_y))
+            total_content_height += self.pad70y + (len(email.attachments) * self.pad30y)
 
         # Calculate max scroll
-        self.max_scroll = max(0, total_content_height - visible_height + int(50 * self.scale_y))
+        self.max_scroll = max(0, total_content_height - visible_height + self.pad50y)
 
         # Clamp scroll position
         self.content_scroll = max(0, min(self.content_scroll, self.max_scroll))
 
-        # Create clipping rect for scrollable area
-        clip_rect = pygame.Rect(content_x, body_start_y, content_width + int(10 * self.scale_x), visible_height)
-        self.screen.set_clip(clip_rect)
-
-        # Draw body text
-        for i, line in enumerate(lines):
-            line_y = body_start_y + (i * line_height) - self.content_scroll
-            if body_start_y - line_height < line_y < body_start_y + visible_height:
-                if line.strip():
-                    line_text = self.body_font.render(line, True, self.text_color)
-                    self.screen.blit(line_text, (content_x, line_y))
-
-        # Attachments
-        if email.attachments:
-            attach_y = body_start_y + (len(lines) * line_height) + int(30 * self.scale_y) - self.content_scroll
-
-            attach_label = self.heading_font.render("FICHIERS JOINTS:", True, self.unread_marker)
-            self.screen.blit(attach_label, (content_x, attach_y))
-
-            for i, attachment in enumerate(email.attachments):
-                attach_text = self.body_font.render(f"[+] {attachment}", True, self.text_color)
-                self.screen.blit(attach_text, (content_x, attach_y + int(35 * self.scale_y) + (i * int(30 * self.scale_y))))
-
-        # Remove clipping
-        self.screen.set_clip(None)
+        # One blit shows the visible window of the pre-composed body; the
+        # source area doubles as both scroll and clip, so set_clip is gone
+        body_surf = self._get_body_surface(email, content_width + self.pad10x)
+        area = pygame.Rect(0, self.content_scroll, content_width + self.pad10x, visible_height)
+        self.screen.blit(body_surf, (content_x, body_start_y), area)
 
         # Draw scroll bar (only if content is scrollable)
         if self.max_scroll > 0:
-            scrollbar_x = self.screen_width - int(25 * self.scale_x)
+            scrollbar_x = self.screen_width - self.pad25x
             scrollbar_track_height = visible_height
 
             # Track background
-            track_rect = pygame.Rect(scrollbar_x, body_start_y, scrollbar_width, scrollbar_track_height)
-            pygame.draw.rect(self.screen, (40, 45, 55), track_rect, border_radius=int(4 * self.scale))
+            self.screen.blit(self._round_rect((scrollbar_width, scrollbar_track_height),
+                                              (40, 45, 55), self.radius4),
+                             (scrollbar_x, body_start_y))
 
             # Calculate thumb size and position
-            thumb_height = max(int(40 * self.scale_y), int(scrollbar_track_height * (visible_height / total_content_height)))
+            thumb_height = max(self.pad40y, int(scrollbar_track_height * (visible_height / total_content_height)))
             scroll_ratio = self.content_scroll / self.max_scroll if self.max_scroll > 0 else 0
             thumb_y = body_start_y + int(scroll_ratio * (scrollbar_track_height - thumb_height))
 
             # Thumb
             thumb_rect = pygame.Rect(scrollbar_x, thumb_y, scrollbar_width, thumb_height)
             thumb_color = (0, 255, 65) if thumb_rect.collidepoint(mouse_pos) else (80, 100, 90)
-            pygame.draw.rect(self.screen, thumb_color, thumb_rect, border_radius=int(4 * self.scale))
+            self.screen.blit(self._round_rect((scrollbar_width, thumb_height),
+                                              thumb_color, self.radius4),
+                             (scrollbar_x, thumb_y))
 
         # Reply button (for Le Professeur's Mission 1 email)
         if email.id == "prof_001_welcome":
-            reply_button_y = self.screen_height - int(100 * self.scale_y)
-            reply_button_width = int(200 * self.scale_x)
-            reply_button_height = int(50 * self.scale_y)
+            reply_button_y = self.screen_height - self.pad100y
+            reply_button_width = self.reply_button_width
+            reply_button_height = self.pad50y
             reply_button_x = content_x + (content_width - reply_button_width) // 2
 
             self.reply_button_rect = pygame.Rect(reply_button_x, reply_button_y, reply_button_width, reply_button_height)
@@ -418,23 +610,137 @@ C'est le moment de prouver ta valeur. Bonne chance.
             button_border = (0, 255, 255) if is_reply_hovered else (42, 63, 90)
 
             # Draw button
-            pygame.draw.rect(self.screen, button_bg, self.reply_button_rect, border_radius=int(8 * self.scale))
-            pygame.draw.rect(self.screen, button_border, self.reply_button_rect, 3, border_radius=int(8 * self.scale))
+            pygame.draw.rect(self.screen, button_bg, self.reply_button_rect, border_radius=self.radius8)
+            pygame.draw.rect(self.screen, button_border, self.reply_button_rect, 3, border_radius=self.radius8)
 
             # Button text
-            reply_text = self.body_font.render("REPONDRE", True, (0, 255, 255) if is_reply_hovered else (200, 200, 200))
+            reply_text = self._render(self.body_font, "REPONDRE",
+                                       (0, 255, 255) if is_reply_hovered else (200, 200, 200))
             reply_text_rect = reply_text.get_rect(center=self.reply_button_rect.center)
             self.screen.blit(reply_text, reply_text_rect)
         else:
             self.reply_button_rect = None
 
         # Instructions at bottom
-        instructions_y = self.screen_height - int(40 * self.scale_y)
-        instructions = self.small_font.render("ENTREE: Lancer Mission | ECHAP: Retour Bureau | FLECHES: Navigation",
-                                             True, self.border_color)
+        instructions_y = self.screen_height - self.pad40y
+        instructions = self._render(self.small_font,
+                                      "ENTREE: Lancer Mission | ECHAP: Retour Bureau | FLECHES: Navigation",
+                                      self.border_color)
         instructions_rect = instructions.get_rect(centerx=(content_x + content_width // 2), top=instructions_y)
         self.screen.blit(instructions, instructions_rect)
 
+    def _select_email(self, index: int):
+        """Select an email, marking it read and resetting the scroll"""
+        self.selected_email_index = index
+        if index < len(self.emails):
+            email = self.emails[index]
+            if not email.read:
+                email.read = True
+                self.unread_count -= 1
+                self.notification_manager.mark_email_read(email.id)
+        self.content_scroll = 0
+
+    def _on_quit(self, event) -> Tuple[str, Optional[str]]:
+        return "exit", None
+
+    def _on_key(self, event) -> Optional[Tuple[str, Optional[str]]]:
+        handler = self._key_handlers.get(event.key)
+        if handler is not None:
+            return handler()
+        return None
+
+    def _on_escape(self) -> Tuple[str, Optional[str]]:
+        return "desktop", None
+
+    def _on_return(self) -> Optional[Tuple[str, Optional[str]]]:
+        if self.selected_email_index is None:
+            return None
+        # Launch selected mission
+        email = self.emails[self.selected_email_index]
+        if not email.read:
+            email.read = True
+            self.unread_count -= 1
+        return "launch_mission", email.mission_id
+
+    def _on_up(self) -> None:
+        if self.selected_email_index is not None:
+            self._select_email(max(0, self.selected_email_index - 1))
+
+    def _on_down(self) -> None:
+        if self.selected_email_index is not None:
+            self._select_email(min(len(self.emails) - 1,
+                                   self.selected_email_index + 1))
+
+    def _on_wheel(self, event) -> None:
+        # Scroll email content with mouse wheel
+        self.content_scroll -= event.y * self.scroll_speed
+        self.content_scroll = max(0, min(self.content_scroll, self.max_scroll))
+
+    def _on_click(self, event) -> None:
+        if event.button != 1:  # Left click only
+            return
+
+        # Check reply button first
+        reply_rect = getattr(self, 'reply_button_rect', None)
+        if reply_rect and reply_rect.collidepoint(event.pos):
+            # Open email composer for Mission 1
+            from src.ui.email_composer import Mission1EmailComposer
+            composer = Mission1EmailComposer(self.screen)
+            composer_result, submitted_data = composer.run()
+
+            if composer_result == "sent" and submitted_data:
+                # Validate the submitted data
+                player_name = self.profile_data.get('nickname', 'Player')
+                net_sim = get_network_simulator(player_name)
+                validation_results = net_sim.validate_mission1_data(submitted_data)
+
+                # Check if all fields are correct
+                all_correct = all(validation_results.values())
+
+                if all_correct:
+                    # Success! Award rewards and send completion email
+                    success_email_data = get_mission1_success_email(player_name)
+
+                    # Add success email to inbox
+                    success_email = Email(
+                        id=success_email_data["id"],
+                        sender=success_email_data["sender"],
+                        subject=success_email_data["subject"],
+                        body=success_email_data["body"],
+                        mission_id=success_email_data.get("mission_id"),
+                        attachments=success_email_data.get("attachments", []),
+                        read=False
+                    )
+                    self.emails.append(success_email)
+                    self.unread_count += 1
+                    self._rebuild_rows()
+
+                    # Award rewards
+                    self.profile_data['progress']['xp'] += 100
+                    self.profile_data['progress']['level'] = 'Debutant'  # Reputation: Debutant
+                    if 'Network Scout' not in self.profile_data['progress']['badges']:
+                        self.profile_data['progress']['badges'].append('Network Scout')
+                    if 'mission1' not in self.profile_data['progress']['missions_completed']:
+                        self.profile_data['progress']['missions_completed'].append('mission1')
+
+                    # Show success message
+                    from src.ui.show_message import show_message
+                    show_message(self.screen, "[OK] Mission 1 completee! +100 XP, Badge obtenu!", (0, 255, 0), 3000)
+
+                    # Trigger notification for new email
+                    self.notification_manager.add_notification(success_email.id)
+                else:
+                    # Show error message with which fields were wrong
+                    wrong_fields = [field for field, correct in validation_results.items() if not correct]
+                    error_msg = f"[X] Erreur: Verifiez {', '.join(wrong_fields)}"
+                    from src.ui.show_message import show_message
+                    show_message(self.screen, error_msg, (255, 0, 0), 3000)
+
+        # Check email list clicks
+        index = self._sidebar_hover_index(event.pos)
+        if index is not None:
+            self._select_email(index)
+
     def run(self) -> Tuple[str, Optional[str]]:
         """
         Run the inbox interface
@@ -444,9 +750,21 @@ C'est le moment de prouver ta valeur. Bonne chance.
             result: "exit", "desktop", "launch_mission"
             mission_id: Mission to launch (if result is "launch_mission")
         """
+        # Restrict the SDL queue to the event types the loop handles, so
+        # motion floods and unsubscribed device events are dropped in C
+        # before a Python event object is ever built
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN,
+                                  pygame.MOUSEWHEEL, pygame.MOUSEBUTTONDOWN])
+        try:
+            return self._run_loop()
+        finally:
+            pygame.event.set_allowed(None)
+
+    def _run_loop(self) -> Tuple[str, Optional[str]]:
+        """Frame loop behind run(); split out so run() can restore the
+        event filter however the loop exits"""
         clock = pygame.time.Clock()
-        running = True
-        email_rects = []
 
         # Clear notification badge when inbox is opened
         self.notification_manager.clear_notification()
@@ -454,129 +772,76 @@ C'est le moment de prouver ta valeur. Bonne chance.
         # Mark first email as read when inbox opens
         if self.emails and not self.emails[0].read:
             self.emails[0].read = True
+            self.unread_count -= 1
             # Mark this email as read in notification manager
             self.notification_manager.mark_email_read(self.emails[0].id)
 
-        while running:
-            clock.tick(60)
+        last_state = None
+        # Pane rects for partial presents: hover-only and scroll-only
+        # frames push just the pane that changed instead of the whole screen
+        sidebar_area = pygame.Rect(0, 0, self.sidebar_width, self.screen_height)
+        content_area = pygame.Rect(self.sidebar_width, 0,
+                                   self.screen_width - self.sidebar_width,
+                                   self.screen_height)
+
+        idle = False
+
+        while True:
+            # Nothing on this screen animates: once frames start being
+            # skipped, poll at 15 Hz and return to 60 while state changes
+            clock.tick(15 if idle else 60)
             mouse_pos = pygame.mouse.get_pos()
 
-            # Event handling
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return "exit", None
-
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        return "desktop", None
-
-                    elif event.key == pygame.K_RETURN and self.selected_email_index is not None:
-                        # Launch selected mission
-                        email = self.emails[self.selected_email_index]
-                        email.read = True
-                        return "launch_mission", email.mission_id
-
-                    elif event.key == pygame.K_UP and self.selected_email_index is not None:
-                        self.selected_email_index = max(0, self.selected_email_index - 1)
-                        if self.selected_email_index < len(self.emails):
-                            email = self.emails[self.selected_email_index]
-                            if not email.read:
-                                email.read = True
-                                self.notification_manager.mark_email_read(email.id)
-                        self.content_scroll = 0
-
-                    elif event.key == pygame.K_DOWN and self.selected_email_index is not None:
-                        self.selected_email_index = min(len(self.emails) - 1, self.selected_email_index + 1)
-                        if self.selected_email_index < len(self.emails):
-                            email = self.emails[self.selected_email_index]
-                            if not email.read:
-                                email.read = True
-                                self.notification_manager.mark_email_read(email.id)
-                        self.content_scroll = 0
-
-                elif event.type == pygame.MOUSEWHEEL:
-                    # Scroll email content with mouse wheel
-                    self.content_scroll -= event.y * self.scroll_speed
-                    self.content_scroll = max(0, min(self.content_scroll, self.max_scroll))
-
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:  # Left click
-                        # Check reply button first
-                        if hasattr(self, 'reply_button_rect') and self.reply_button_rect and self.reply_button_rect.collidepoint(event.pos):
-                            # Open email composer for Mission 1
-                            from src.ui.email_composer import Mission1EmailComposer
-                            composer = Mission1EmailComposer(self.screen)
-                            composer_result, submitted_data = composer.run()
-
-                            if composer_result == "sent" and submitted_data:
-                                # Validate the submitted data
-                                from src.core.network_simulation import get_network_simulator
-                                player_name = self.profile_data.get('nickname', 'Player')
-                                net_sim = get_network_simulator(player_name)
-                                validation_results = net_sim.validate_mission1_data(submitted_data)
-
-                                # Check if all fields are correct
-                                all_correct = all(validation_results.values())
-
-                                if all_correct:
-                                    # Success! Award rewards and send completion email
-                                    from src.data.professor_emails import get_mission1_success_email
-                                    success_email_data = get_mission1_success_email(player_name)
-
-                                    # Add success email to inbox
-                                    success_email = Email(
-                                        id=success_email_data["id"],
-                                        sender=success_email_data["sender"],
-                                        subject=success_email_data["subject"],
-                                        body=success_email_data["body"],
-                                        mission_id=success_email_data.get("mission_id"),
-                                        attachments=success_email_data.get("attachments", []),
-                                        read=False
-                                    )
-                                    self.emails.append(success_email)
-
-                                    # Award rewards
-                                    self.profile_data['progress']['xp'] += 100
-                                    self.profile_data['progress']['level'] = 'Debutant'  # Reputation: Debutant
-                                    if 'Network Scout' not in self.profile_data['progress']['badges']:
-                                        self.profile_data['progress']['badges'].append('Network Scout')
-                                    if 'mission1' not in self.profile_data['progress']['missions_completed']:
-                                        self.profile_data['progress']['missions_completed'].append('mission1')
-
-                                    # Show success message
-                                    from src.ui.show_message import show_message
-                                    show_message(self.screen, "[OK] Mission 1 completee! +100 XP, Badge obtenu!", (0, 255, 0), 3000)
-
-                                    # Trigger notification for new email
-                                    from src.systems.notification_manager import get_notification_manager
-                                    notification_manager = get_notification_manager()
-                                    notification_manager.add_notification(success_email.id)
-                                else:
-                                    # Show error message with which fields were wrong
-                                    wrong_fields = [field for field, correct in validation_results.items() if not correct]
-                                    error_msg = f"[X] Erreur: Verifiez {', '.join(wrong_fields)}"
-                                    from src.ui.show_message import show_message
-                                    show_message(self.screen, error_msg, (255, 0, 0), 3000)
-
-                        # Check email list clicks
-                        for i, rect in enumerate(email_rects):
-                            if rect.collidepoint(event.pos):
-                                self.selected_email_index = i
-                                email = self.emails[i]
-                                if not email.read:
-                                    email.read = True
-                                    self.notification_manager.mark_email_read(email.id)
-                                self.content_scroll = 0
+            # Event handling; events can change state the snapshot doesn't
+            # cover (read flags, new emails), so they force a full repaint.
+            # Wheel only moves the scroll, which the snapshot tracks.
+            events = pygame.event.get()
+            for event in events:
+                if event.type != pygame.MOUSEWHEEL:
+                    self._dirty = True
+            for event in events:
+                handler = self._event_handlers.get(event.type)
+                if handler is not None:
+                    result = handler(event)
+                    if result is not None:
+                        return result
+
+            # Skip the repaint while nothing moved: hover effects depend on
+            # the mouse, so its position is part of the snapshot
+            state = (self.selected_email_index, self.content_scroll,
+                     len(self.emails), mouse_pos)
+            if not self._dirty and state == last_state:
+                idle = True
+                continue
+            idle = False
+            prev_state = last_state
+            last_state = state
+            full_present = (self._dirty or prev_state is None
+                            or state[0] != prev_state[0]
+                            or state[2] != prev_state[2])
+            self._dirty = False
 
             # Drawing
             self.screen.fill(self.bg_color)
 
             # Draw sidebar with emails
-            email_rects = self.draw_sidebar(mouse_pos)
+            self.draw_sidebar(mouse_pos)
 
             # Draw content
             self.draw_content(mouse_pos)
 
-            pygame.display.flip()
-
-        return "exit", None
+            if full_present:
+                pygame.display.flip()
+            else:
+                # Mouse-motion and scroll frames only touch one pane
+                dirty = []
+                if state[3] != prev_state[3]:
+                    if (state[3][0] < self.sidebar_width
+                            or prev_state[3][0] < self.sidebar_width):
+                        dirty.append(sidebar_area)
+                    if (state[3][0] >= self.sidebar_width
+                            or prev_state[3][0] >= self.sidebar_width):
+                        dirty.append(content_area)
+                if state[1] != prev_state[1] and content_area not in dirty:
+                    dirty.append(content_area)
+                pygame.display.update(dirty)
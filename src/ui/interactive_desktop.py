@@ -6,7 +6,7 @@ Replaces static image-based desktop with dynamic UI
 
 import pygame
 import os
-from datetime import datetime
+import time
 from typing import Optional, Tuple, Dict, List
 
 class InteractiveDesktop:
@@ -102,13 +102,53 @@ class InteractiveDesktop:
         # Hovered icon
         self.hovered_icon = None
 
+        # Last drawn clock rect, for dirty-rect updates; the rendered
+        # surface is reused until the second rolls over
+        self._clock_rect = None
+        self._clock_surf = None
+        self._last_sec = -1
 
-        # Back button rect
-        self.back_button_rect = None
+        # Back button rect (fixed position, only its color reacts to hover)
+        button_width = int(120 * self.scale_x)
+        button_height = int(40 * self.scale_y)
+        self.back_button_rect = pygame.Rect(self.screen_width - button_width - int(20 * self.scale_x),
+                                            int(15 * self.scale_y), button_width, button_height)
+
+        # Constant labels, rasterized once
+        self._title_surf = self.title_font.render("CYBER HERO OS", True, self.terminal_color)
+        self._title_rect = self._title_surf.get_rect(left=int(30 * self.scale_x), centery=int(35 * self.scale_y))
+        self._back_text_surf = self.status_font.render("RETOUR", True, (255, 255, 255))
+        self._back_text_rect = self._back_text_surf.get_rect(center=self.back_button_rect.center)
 
         # Player stats (from profile)
+        self._stats_snapshot = None
+        self._static_bg = None
+        self._status_cache = {}
         self.update_player_stats()
 
+        # Everything that only changes when the stats change (background fill,
+        # title/status bars, non-hovered icons) is baked into one surface;
+        # per-frame draw blits it and overlays hover, clock and back button
+        self._build_icon_layout()
+        self._static_bg = pygame.Surface((self.screen_width, self.screen_height)).convert()
+        self._render_static(self._static_bg)
+
+    def _build_icon_layout(self):
+        """Compute the fixed 3x3 icon rects and pre-render each label once"""
+        rects = []
+        for idx, icon in enumerate(self.icons):
+            row = idx // self.grid_cols
+            col = idx % self.grid_cols
+
+            x = self.grid_start_x + col * (self.icon_width + self.icon_spacing_x)
+            y = self.grid_start_y + row * (self.icon_height + self.icon_spacing_y)
+            rects.append((pygame.Rect(x, y, self.icon_width, self.icon_height), icon))
+
+        self._icon_rects = tuple(rects)
+        self._icon_name_surfs = tuple(
+            self.icon_font.render(icon['name'], True, icon['color'])
+            for _, icon in self._icon_rects)
+
     def update_player_stats(self):
         """Update player statistics from profile"""
         progress = self.player_profile.get('progress', {})
@@ -124,117 +164,123 @@ class InteractiveDesktop:
         self.new_contracts = len(unlocked_missions) - len(completed_missions)
         self.alerts = progress.get('alerts', 2)
 
-    def draw_title_bar(self, mouse_pos):
-        """Draw top title bar with time and settings icon"""
-        # Title bar background
-        title_bar_rect = pygame.Rect(0, 0, self.screen_width, int(70 * self.scale_y))
-        pygame.draw.rect(self.screen, self.title_bg, title_bar_rect)
+        # Re-bake the static surface only when a displayed value changed
+        snapshot = (self.credits, self.level, self.new_contracts, self.alerts)
+        if snapshot != self._stats_snapshot:
+            self._stats_snapshot = snapshot
+            if self._static_bg is not None:
+                self._render_static(self._static_bg)
 
-        # Retour Button (Top Right)
-        button_width = int(120 * self.scale_x)
-        button_height = int(40 * self.scale_y)
-        self.back_button_rect = pygame.Rect(self.screen_width - button_width - int(20 * self.scale_x), int(15 * self.scale_y), button_width, button_height)
-        
-        is_back_hovered = self.back_button_rect.collidepoint(mouse_pos)
-        back_color = (200, 60, 60) if is_back_hovered else (160, 40, 40) # Reddish for exit
-        
-        pygame.draw.rect(self.screen, back_color, self.back_button_rect, border_radius=int(5 * self.scale))
-        
-        back_text = self.status_font.render("RETOUR", True, (255, 255, 255))
-        back_text_rect = back_text.get_rect(center=self.back_button_rect.center)
-        self.screen.blit(back_text, back_text_rect)
+    def _render_static(self, surface):
+        """Bake every pixel that survives between stat updates into one surface"""
+        surface.fill(self.bg_color)
+
+        # Title bar background and title
+        pygame.draw.rect(surface, self.title_bg, (0, 0, self.screen_width, int(70 * self.scale_y)))
+        surface.blit(self._title_surf, self._title_rect)
+
+        # Status bar
+        self.draw_status_bar(surface)
+
+        # Icon grid, non-hovered state (rects and labels cached in __init__)
+        for idx, (icon_rect, icon) in enumerate(self._icon_rects):
+            self._draw_icon(surface, idx, icon_rect, icon, hovered=False)
 
-        # Title text
-        title_text = self.title_font.render("CYBER HERO OS", True, self.terminal_color)
-        title_rect = title_text.get_rect(left=int(30 * self.scale_x), centery=int(35 * self.scale_y))
-        self.screen.blit(title_text, title_rect)
+    def _draw_icon(self, surface, idx, icon_rect, icon, hovered):
+        """Draw one icon's background, border and pre-rendered label"""
+        bg_color = self.icon_hover if hovered else self.icon_bg
+        pygame.draw.rect(surface, bg_color, icon_rect, border_radius=int(8 * self.scale))
 
-        # Current time
-        current_time = datetime.now().strftime("[%H:%M:%S]")
-        time_text = self.time_font.render(current_time, True, self.terminal_color)
-        time_rect = time_text.get_rect(right=self.back_button_rect.left - int(30 * self.scale_x), centery=int(35 * self.scale_y))
-        self.screen.blit(time_text, time_rect)
+        border_color = icon['color'] if hovered else self.border_color
+        border_width = int(3 * self.scale) if hovered else int(2 * self.scale)
+        pygame.draw.rect(surface, border_color, icon_rect, border_width, border_radius=int(8 * self.scale))
 
+        name_text = self._icon_name_surfs[idx]
+        name_rect = name_text.get_rect(center=icon_rect.center)
+        surface.blit(name_text, name_rect)
+
+    def draw_title_bar(self, mouse_pos):
+        """Draw the per-frame parts of the title bar: back button and clock"""
+        # Retour Button (Top Right)
+        is_back_hovered = self.back_button_rect.collidepoint(mouse_pos)
+        back_color = (200, 60, 60) if is_back_hovered else (160, 40, 40) # Reddish for exit
 
-    def draw_status_bar(self):
+        pygame.draw.rect(self.screen, back_color, self.back_button_rect, border_radius=int(5 * self.scale))
+        self.screen.blit(self._back_text_surf, self._back_text_rect)
+
+        # Current time; strftime and render run only when the second changes
+        now_sec = int(time.time())
+        if now_sec != self._last_sec:
+            current_time = time.strftime("[%H:%M:%S]", time.localtime(now_sec))
+            self._clock_surf = self.time_font.render(current_time, True, self.terminal_color)
+            self._last_sec = now_sec
+        time_rect = self._clock_surf.get_rect(right=self.back_button_rect.left - int(30 * self.scale_x), centery=int(35 * self.scale_y))
+        self.screen.blit(self._clock_surf, time_rect)
+        self._clock_rect = time_rect
+
+
+    def _status_text(self, text, color) -> pygame.Surface:
+        """Render a status string through the cache; a stat that did not
+        change between two bakes reuses its surface"""
+        key = (text, color)
+        surf = self._status_cache.get(key)
+        if surf is None:
+            surf = self.status_font.render(text, True, color)
+            self._status_cache[key] = surf
+        return surf
+
+    def draw_status_bar(self, surface):
         """Draw bottom status bar with player stats - TEXT ONLY"""
         # Status bar background
         status_y = self.screen_height - int(80 * self.scale_y)
         status_rect = pygame.Rect(0, status_y, self.screen_width, int(80 * self.scale_y))
-        pygame.draw.rect(self.screen, self.title_bg, status_rect)
+        pygame.draw.rect(surface, self.title_bg, status_rect)
 
         # Calculate total width needed for all stats
         spacing = int(50 * self.scale_x)
-        
+
         # Credits
-        credits_text = self.status_font.render(f"Credits: {self.credits}€", True, self.credits_color)
+        credits_text = self._status_text(f"Credits: {self.credits}€", self.credits_color)
         credits_rect = credits_text.get_rect(left=int(30 * self.scale_x), centery=status_y + int(40 * self.scale_y))
-        self.screen.blit(credits_text, credits_rect)
+        surface.blit(credits_text, credits_rect)
 
         # Reputation
-        rep_text = self.status_font.render(f"Rep: {self.level}", True, self.rep_color)
+        rep_text = self._status_text(f"Rep: {self.level}", self.rep_color)
         rep_rect = rep_text.get_rect(left=credits_rect.right + spacing, centery=status_y + int(40 * self.scale_y))
-        self.screen.blit(rep_text, rep_rect)
+        surface.blit(rep_text, rep_rect)
 
         # New Contracts
-        contracts_text = self.status_font.render(f"Nouveaux Contrats: {self.new_contracts}", True, self.mail_color)
+        contracts_text = self._status_text(f"Nouveaux Contrats: {self.new_contracts}", self.mail_color)
         contracts_rect = contracts_text.get_rect(left=rep_rect.right + spacing, centery=status_y + int(40 * self.scale_y))
-        self.screen.blit(contracts_text, contracts_rect)
+        surface.blit(contracts_text, contracts_rect)
 
         # Alerts
-        alerts_text = self.status_font.render(f"Alertes: {self.alerts}", True, self.alerts_color)
+        alerts_text = self._status_text(f"Alertes: {self.alerts}", self.alerts_color)
         alerts_rect = alerts_text.get_rect(left=contracts_rect.right + spacing, centery=status_y + int(40 * self.scale_y))
-        self.screen.blit(alerts_text, alerts_rect)
+        surface.blit(alerts_text, alerts_rect)
 
     def draw_icon_grid(self, mouse_pos):
-        """Draw grid of application icons - TEXT ONLY"""
-        icon_rects = []
-
-        for idx, icon in enumerate(self.icons):
-            row = idx // self.grid_cols
-            col = idx % self.grid_cols
-
-            x = self.grid_start_x + col * (self.icon_width + self.icon_spacing_x)
-            y = self.grid_start_y + row * (self.icon_height + self.icon_spacing_y)
-
-            # Create icon rect
-            icon_rect = pygame.Rect(x, y, self.icon_width, self.icon_height)
-            icon_rects.append((icon_rect, icon))
-
-            # Check if hovered
-            is_hovered = icon_rect.collidepoint(mouse_pos)
-
-            # Background color
-            bg_color = self.icon_hover if is_hovered else self.icon_bg
-
-            # Draw icon background
-            pygame.draw.rect(self.screen, bg_color, icon_rect, border_radius=int(8 * self.scale))
-
-            # Draw border (highlighted if hovered)
-            border_color = icon['color'] if is_hovered else self.border_color
-            border_width = int(3 * self.scale) if is_hovered else int(2 * self.scale)
-            pygame.draw.rect(self.screen, border_color, icon_rect, border_width, border_radius=int(8 * self.scale))
+        """Overlay the hover highlight; static icons come from the baked surface"""
+        self.hovered_icon = None
 
-            # Draw icon name ONLY - centered in the box
-            name_text = self.icon_font.render(icon['name'], True, icon['color'])
-            name_rect = name_text.get_rect(center=icon_rect.center)
-            self.screen.blit(name_text, name_rect)
+        for idx, (icon_rect, icon) in enumerate(self._icon_rects):
+            if icon_rect.collidepoint(mouse_pos):
+                self.hovered_icon = icon_rect
+                self._draw_icon(self.screen, idx, icon_rect, icon, hovered=True)
+                break
 
-        return icon_rects
+        return self._icon_rects
 
     def draw(self, mouse_pos):
         """Draw the entire desktop"""
-        # Background
-        self.screen.fill(self.bg_color)
-
-        # Title bar (with settings icon)
-        self.draw_title_bar(mouse_pos)
+        # Static pixels (background, bars, non-hovered icons) in one blit
+        self.screen.blit(self._static_bg, (0, 0))
 
-        # Icon grid
+        # Hover highlight
         icon_rects = self.draw_icon_grid(mouse_pos)
 
-        # Status bar
-        self.draw_status_bar()
+        # Back button and clock
+        self.draw_title_bar(mouse_pos)
 
         return icon_rects
 
@@ -348,18 +394,65 @@ class InteractiveDesktop:
             result: "exit", "action", "menu", "restart"
             action: clicked application action
         """
+        # Keep unused event types (window, text input, ...) out of the queue
+        # entirely so they are never allocated as Python objects. MOUSEMOTION
+        # stays allowed: it is the wakeup source for hover updates. Other
+        # screens use wheel/button-up events, so the filter is restored on
+        # the way out; the confirmation popup only reads types allowed here.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN,
+                                  pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION])
+        try:
+            return self._run_loop()
+        finally:
+            pygame.event.set_allowed(None)
+
+    def _run_loop(self) -> Tuple[str, Optional[str]]:
+        """Event/draw loop behind run()'s queue filter"""
         running = True
         icon_rects = []
 
+        # Dirty-rect bookkeeping: only the regions that can change between
+        # frames (hover highlight, clock, back button) are pushed to the
+        # window; the first frame and every return from the popup flip fully
+        full_redraw = True
+        prev_hover_rect = None
+        prev_clock_rect = None
+
+        # The desktop is static between mouse moves, notification pulses and
+        # clock ticks, so idle frames block in event.wait instead of polling
+        # at 60 FPS; the timeout lands on the next second boundary so the
+        # clock still advances on time
+        self._needs_redraw = True
+        last_second = None
+
         while running:
-            dt = self.clock.tick(60) / 1000.0  # Delta time in seconds
+            if self.notification_manager.show_notification:
+                # Animation in flight: keep the fixed-rate loop
+                dt = self.clock.tick(60) / 1000.0  # Delta time in seconds
+                self.notification_manager.update(dt)
+                self._needs_redraw = True
+                events = pygame.event.get()
+            else:
+                timeout_ms = max(1, int((1.0 - (time.time() % 1.0)) * 1000))
+                first = pygame.event.wait(timeout_ms)
+                events = pygame.event.get()
+                if first.type != pygame.NOEVENT:
+                    events.insert(0, first)
+
+            # Clock second rollover forces one redraw per second
+            second = int(time.time())
+            if second != last_second:
+                last_second = second
+                self._needs_redraw = True
+
             mouse_pos = pygame.mouse.get_pos()
 
-            # Update notification animation
-            self.notification_manager.update(dt)
+            for event in events:
+                if event.type == pygame.MOUSEMOTION:
+                    self._needs_redraw = True
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+                elif event.type == pygame.QUIT:
                     return "exit", None
 
                 elif event.type == pygame.KEYDOWN:
@@ -369,6 +462,8 @@ class InteractiveDesktop:
                         if confirmed:  # User clicked OUI
                             return "restart", None  # Signal to restart the game
                         # If not confirmed (NON clicked), continue normally
+                        full_redraw = True
+                        self._needs_redraw = True
                         
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:  # Left click
@@ -378,11 +473,29 @@ class InteractiveDesktop:
                                 confirmed = self.show_confirmation_popup()
                                 if confirmed:
                                     return "restart", None
+                                full_redraw = True
+                                self._needs_redraw = True
                                 continue
                             return "action", action
 
+            if not self._needs_redraw:
+                continue
+            self._needs_redraw = False
+
             # Draw (this will clear the popup if NON was clicked)
             icon_rects = self.draw(mouse_pos)
-            pygame.display.flip()
+
+            if full_redraw:
+                pygame.display.flip()
+                full_redraw = False
+            else:
+                dirty = [r for r in (prev_hover_rect, self.hovered_icon,
+                                     prev_clock_rect, self._clock_rect,
+                                     self.back_button_rect) if r]
+                if dirty:
+                    pygame.display.update(dirty)
+
+            prev_hover_rect = self.hovered_icon
+            prev_clock_rect = self._clock_rect
 
         return "exit", None
\ No newline at end of file